@@ -4,7 +4,7 @@ Base classes and specialized agents for workflow automation
 Multi-domain support: Legal, HR, Customer Service, and more
 """
 
-from agents.base_agent import BaseAgent
+from agents.base_agent import BaseAgent, agent_concurrency, run_agent
 from agents.legal_agent import LegalResearchAgent
 from agents.hr_policy_agent import HRPolicyAgent
 from agents.cs_document_agent import CSDocumentAgent
@@ -15,6 +15,8 @@ from agents.orchestrator import WorkflowOrchestrator
 
 __all__ = [
     "BaseAgent",
+    "run_agent",
+    "agent_concurrency",
     "LegalResearchAgent",
     "HRPolicyAgent",
     "CSDocumentAgent",
@@ -445,7 +445,7 @@ Respond in JSON format:
         elif isinstance(data, list):
             return "\n\n---\n\n".join(str(item) for item in data)
         elif isinstance(data, dict):
-            return json.dumps(data, indent=2)
+            return self._to_json_text(data)
         else:
             return str(data)
 
@@ -5,10 +5,52 @@ Provides foundation for all specialized agents
 
 from typing import Dict, List, Any, Optional
 from abc import ABC, abstractmethod
+import asyncio
 import logging
+import orjson
+import os
 
 logger = logging.getLogger(__name__)
 
+# Cap on agent executions in flight per process - every agent call ends up at
+# the single Ollama backend, which degrades badly under unbounded parallelism
+MAX_CONCURRENT_AGENTS = int(os.getenv("MAX_CONCURRENT_AGENTS", "4"))
+_AGENT_SEM = asyncio.Semaphore(MAX_CONCURRENT_AGENTS)
+_agents_running = 0
+_agents_waiting = 0
+
+
+def agent_concurrency() -> Dict[str, int]:
+    """Current agent concurrency (running / waiting for a slot / limit)"""
+    return {
+        "running": _agents_running,
+        "waiting": _agents_waiting,
+        "limit": MAX_CONCURRENT_AGENTS
+    }
+
+
+async def run_agent(agent, task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Execute an agent task under the shared concurrency limit
+
+    At most MAX_CONCURRENT_AGENTS executions run at once; further calls
+    queue on a shared semaphore.
+    """
+    global _agents_running, _agents_waiting
+
+    _agents_waiting += 1
+    try:
+        await _AGENT_SEM.acquire()
+    finally:
+        _agents_waiting -= 1
+
+    _agents_running += 1
+    try:
+        return await agent.execute(task)
+    finally:
+        _agents_running -= 1
+        _AGENT_SEM.release()
+
 
 class BaseAgent(ABC):
     """
@@ -160,5 +202,18 @@ class BaseAgent(ABC):
             "memory_items": len(self.memory)
         }
 
+    @staticmethod
+    def _to_json_text(value: Any) -> str:
+        """
+        Render structured data as indented JSON for a prompt
+
+        Args:
+            value: Dict or list (non-string keys and unknown types are stringified)
+
+        Returns:
+            JSON text
+        """
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+
     def __repr__(self):
         return f"<{self.__class__.__name__} name={self.name} tools={len(self.tools)}>"
@@ -3,14 +3,84 @@ Workflow Orchestrator
 Coordinates multiple agents to execute complex multi-step workflows
 """
 
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Tuple
 import logging
 import asyncio
 from datetime import datetime
 import re
 
+from agents.base_agent import run_agent
+
 logger = logging.getLogger(__name__)
 
+VARIABLE_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# A compiled input template: builds the task input from the workflow context
+Resolver = Callable[[Dict[str, Any]], Any]
+
+
+def _lookup(data: Dict, keys: Tuple[str, ...]) -> Any:
+    """Follow pre-split dot-path keys through nested dicts (None if missing)"""
+    value = data
+    for key in keys:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+        if value is None:
+            return None
+    return value
+
+
+def compile_template(input_template: Any) -> Resolver:
+    """
+    Compile an input template into a resolver function
+
+    ${variable.path} references are parsed once here, so resolving the template
+    against a context is only dict lookups and string joins.
+
+    Args:
+        input_template: Template with variable references
+
+    Returns:
+        Function mapping a context dict to the resolved input
+    """
+    if isinstance(input_template, str):
+        if '${' not in input_template:
+            return lambda context: input_template
+
+        # Alternating literal text and (keys, placeholder) pairs
+        parts: List[Any] = []
+        pos = 0
+        for match in VARIABLE_PATTERN.finditer(input_template):
+            parts.append(input_template[pos:match.start()])
+            parts.append((tuple(match.group(1).split('.')), match.group(0)))
+            pos = match.end()
+        parts.append(input_template[pos:])
+
+        def resolve_string(context: Dict[str, Any]) -> str:
+            out = []
+            for part in parts:
+                if isinstance(part, str):
+                    out.append(part)
+                else:
+                    value = _lookup(context, part[0])
+                    # Unresolved references are left in place
+                    out.append(part[1] if value is None else str(value))
+            return "".join(out)
+
+        return resolve_string
+
+    elif isinstance(input_template, dict):
+        resolvers = [(key, compile_template(value)) for key, value in input_template.items()]
+        return lambda context: {key: resolve(context) for key, resolve in resolvers}
+
+    elif isinstance(input_template, list):
+        resolvers = [compile_template(item) for item in input_template]
+        return lambda context: [resolve(context) for resolve in resolvers]
+
+    else:
+        return lambda context: input_template
+
 
 class WorkflowOrchestrator:
     """
@@ -24,6 +94,7 @@ class WorkflowOrchestrator:
         """Initialize the orchestrator"""
         self.agents = {}
         self.workflows = {}
+        self.compiled_inputs: Dict[str, Dict[str, Resolver]] = {}
         self.execution_history = []
 
     def register_agent(self, agent):
@@ -36,6 +107,19 @@ class WorkflowOrchestrator:
         self.agents[agent.name] = agent
         logger.info(f"Registered agent: {agent.name}")
 
+    def register_agents(self, agents):
+        """
+        Register several agents at once
+
+        Args:
+            agents: Iterable of BaseAgent instances
+        """
+        names = []
+        for agent in agents:
+            self.agents[agent.name] = agent
+            names.append(agent.name)
+        logger.info(f"Registered agents: {', '.join(names)}")
+
     def register_workflow(self, workflow_name: str, workflow_definition: Dict[str, Any]):
         """
         Register a workflow definition
@@ -45,6 +129,14 @@ class WorkflowOrchestrator:
             workflow_definition: Workflow specification with tasks and dependencies
         """
         self.workflows[workflow_name] = workflow_definition
+
+        # Parse ${...} references once instead of on every execution
+        compiled = {}
+        for entry in workflow_definition["tasks"]:
+            for task in entry["parallel"] if "parallel" in entry else [entry]:
+                compiled[task["task_id"]] = compile_template(task["input"])
+        self.compiled_inputs[workflow_name] = compiled
+
         logger.info(f"Registered workflow: {workflow_name}")
 
     async def execute_workflow(
@@ -62,6 +154,25 @@ class WorkflowOrchestrator:
         Returns:
             Dict with workflow results and metadata
         """
+        async for event in self.execute_workflow_stream(workflow_name, input_data):
+            if event["type"] == "workflow":
+                return event["result"]
+
+    async def execute_workflow_stream(
+        self,
+        workflow_name: str,
+        input_data: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a registered workflow, yielding progress as it happens
+
+        Yields one {"type": "task", ...} event per finished task, then a final
+        {"type": "workflow", "result": ...} event with what execute_workflow returns.
+
+        Args:
+            workflow_name: Name of workflow to execute
+            input_data: Initial input data for workflow
+        """
         start_time = datetime.now()
 
         try:
@@ -79,41 +190,46 @@ class WorkflowOrchestrator:
             }
 
             results = {}
-
-            # Execute tasks in order
-            for task in workflow["tasks"]:
-                task_id = task["task_id"]
-                agent_name = task["agent"]
-
-                logger.info(f"Executing task: {task_id} with agent: {agent_name}")
-
-                # Get agent
-                agent = self.agents.get(agent_name)
-                if not agent:
-                    raise ValueError(f"Agent '{agent_name}' not found")
-
-                # Prepare task input by resolving variables
-                task_input = self._resolve_variables(task["input"], context)
-
-                # Execute agent
-                task_start = datetime.now()
-                result = await agent.execute(task_input)
-                task_duration = (datetime.now() - task_start).total_seconds()
-
-                # Store result in context and results
-                results[task_id] = {
-                    "agent": agent_name,
-                    "result": result,
-                    "duration": task_duration,
-                    "timestamp": datetime.now().isoformat()
-                }
-                context[task_id] = result
-
-                # Check if task failed
-                if result.get("status") == "failed":
-                    logger.error(f"Task {task_id} failed: {result.get('error')}")
-                    if not task.get("continue_on_failure", False):
-                        break
+            compiled = self.compiled_inputs[workflow_name]
+
+            # Execute tasks in order; {"parallel": [...]} entries run concurrently
+            for entry in workflow["tasks"]:
+                group = entry["parallel"] if "parallel" in entry else [entry]
+
+                if len(group) > 1:
+                    logger.info(f"Executing {len(group)} tasks in parallel")
+
+                # Tasks in a group only see context from earlier entries
+                group_results = await asyncio.gather(
+                    *[
+                        self._run_task(task, context, compiled[task["task_id"]])
+                        for task in group
+                    ]
+                )
+
+                stop = False
+                for task, (result, task_duration) in zip(group, group_results):
+                    task_id = task["task_id"]
+
+                    # Store result in context and results
+                    results[task_id] = {
+                        "agent": task["agent"],
+                        "result": result,
+                        "duration": task_duration,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    context[task_id] = result
+
+                    yield {"type": "task", "task_id": task_id, "status": result.get("status"), **results[task_id]}
+
+                    # Check if task failed
+                    if result.get("status") == "failed":
+                        logger.error(f"Task {task_id} failed: {result.get('error')}")
+                        if not task.get("continue_on_failure", False):
+                            stop = True
+
+                if stop:
+                    break
 
             # Get final output
             output_var = workflow.get("output_var")
@@ -139,17 +255,53 @@ class WorkflowOrchestrator:
             })
 
             logger.info(f"Workflow {workflow_name} completed in {execution_time:.1f}s")
-            return workflow_result
 
         except Exception as e:
             logger.error(f"Workflow execution error: {e}", exc_info=True)
-            return {
+            workflow_result = {
                 "workflow": workflow_name,
                 "status": "failed",
                 "error": str(e),
                 "execution_time": (datetime.now() - start_time).total_seconds()
             }
 
+        yield {"type": "workflow", "result": workflow_result}
+
+    async def _run_task(
+        self,
+        task: Dict[str, Any],
+        context: Dict[str, Any],
+        resolve_input: Resolver
+    ) -> Tuple[Dict[str, Any], float]:
+        """
+        Execute a single task definition
+
+        Args:
+            task: Task definition with task_id, agent and input
+            context: Context for variable resolution
+            resolve_input: Compiled input template for the task
+
+        Returns:
+            Tuple of (agent result, duration in seconds)
+        """
+        task_id = task["task_id"]
+        agent_name = task["agent"]
+
+        logger.info(f"Executing task: {task_id} with agent: {agent_name}")
+
+        # Get agent
+        agent = self.agents.get(agent_name)
+        if not agent:
+            raise ValueError(f"Agent '{agent_name}' not found")
+
+        # Prepare task input by resolving variables
+        task_input = resolve_input(context)
+
+        # Execute agent
+        task_start = datetime.now()
+        result = await run_agent(agent, task_input)
+        return result, (datetime.now() - task_start).total_seconds()
+
     async def execute_parallel_tasks(
         self,
         tasks: List[Dict[str, Any]],
@@ -174,7 +326,7 @@ class WorkflowOrchestrator:
                 return task_id, {"status": "failed", "error": f"Agent {agent_name} not found"}
 
             task_input = self._resolve_variables(task["input"], context)
-            result = await agent.execute(task_input)
+            result = await run_agent(agent, task_input)
             return task_id, result
 
         # Execute all tasks concurrently
@@ -197,31 +349,7 @@ class WorkflowOrchestrator:
         Returns:
             Resolved input with variables substituted
         """
-        if isinstance(input_template, str):
-            # Find all ${variable} patterns
-            pattern = r'\$\{([^}]+)\}'
-            matches = re.findall(pattern, input_template)
-
-            for match in matches:
-                value = self._get_nested_value(context, match)
-                if value is not None:
-                    input_template = input_template.replace(f"${{{match}}}", str(value))
-
-            return input_template
-
-        elif isinstance(input_template, dict):
-            # Recursively resolve dict values
-            return {
-                key: self._resolve_variables(value, context)
-                for key, value in input_template.items()
-            }
-
-        elif isinstance(input_template, list):
-            # Recursively resolve list items
-            return [self._resolve_variables(item, context) for item in input_template]
-
-        else:
-            return input_template
+        return compile_template(input_template)(context)
 
     def _get_nested_value(self, data: Dict, path: str) -> Any:
         """
@@ -234,19 +362,7 @@ class WorkflowOrchestrator:
         Returns:
             Value at path or None
         """
-        keys = path.split('.')
-        value = data
-
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-            else:
-                return None
-
-            if value is None:
-                return None
-
-        return value
+        return _lookup(data, tuple(path.split('.')))
 
     def list_agents(self) -> List[Dict[str, Any]]:
         """
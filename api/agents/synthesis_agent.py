@@ -384,7 +384,7 @@ Keep it concise and actionable:
                 elif "analysis" in source:
                     text = str(source["analysis"])
                 else:
-                    text = json.dumps(source, indent=2)
+                    text = self._to_json_text(source)
 
                 # Add source metadata if available
                 source_name = source.get("agent", source.get("source", f"Source {i}"))
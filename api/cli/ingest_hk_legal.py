@@ -70,10 +70,10 @@ async def main():
     # Show current stats
     stats = ingestion_service.get_stats()
     logger.info("\nCurrent Database Status:")
-    logger.info(f"  Documents in PostgreSQL: {stats['documents']}")
-    logger.info(f"  Sections in PostgreSQL: {stats['sections']}")
-    logger.info(f"  Vectors in Qdrant (documents): {stats['qdrant_documents']}")
-    logger.info(f"  Vectors in Qdrant (sections): {stats['qdrant_sections']}")
+    logger.info("  Documents in PostgreSQL: %s", stats['documents'])
+    logger.info("  Sections in PostgreSQL: %s", stats['sections'])
+    logger.info("  Vectors in Qdrant (documents): %s", stats['qdrant_documents'])
+    logger.info("  Vectors in Qdrant (sections): %s", stats['qdrant_sections'])
 
     if args.stats_only:
         logger.info("\nStats-only mode. Exiting.")
@@ -81,13 +81,13 @@ async def main():
 
     # Check if directory exists
     if not os.path.exists(args.directory):
-        logger.error(f"Directory not found: {args.directory}")
+        logger.error("Directory not found: %s", args.directory)
         return
 
     # Run ingestion
-    logger.info(f"\nStarting ingestion from: {args.directory}")
+    logger.info("\nStarting ingestion from: %s", args.directory)
     if args.limit:
-        logger.info(f"Limiting to {args.limit} files")
+        logger.info("Limiting to %s files", args.limit)
 
     result = await ingestion_service.ingest_directory(
         args.directory,
@@ -98,25 +98,25 @@ async def main():
     logger.info("\n" + "=" * 60)
     logger.info("Ingestion Results:")
     logger.info("=" * 60)
-    logger.info(f"Total files processed: {result['total_files']}")
-    logger.info(f"Successful: {result['successful']}")
-    logger.info(f"Skipped (already exists): {result['skipped']}")
-    logger.info(f"Failed: {result['failed']}")
+    logger.info("Total files processed: %s", result['total_files'])
+    logger.info("Successful: %s", result['successful'])
+    logger.info("Skipped (already exists): %s", result['skipped'])
+    logger.info("Failed: %s", result['failed'])
 
     if result['errors']:
         logger.info("\nErrors:")
         for error in result['errors'][:10]:  # Show first 10 errors
-            logger.error(f"  {error['file']}: {error['error']}")
+            logger.error("  %s: %s", error['file'], error['error'])
         if len(result['errors']) > 10:
-            logger.info(f"  ... and {len(result['errors']) - 10} more errors")
+            logger.info("  ... and %d more errors", len(result['errors']) - 10)
 
     # Final stats
     final_stats = ingestion_service.get_stats()
     logger.info("\nFinal Database Status:")
-    logger.info(f"  Documents in PostgreSQL: {final_stats['documents']}")
-    logger.info(f"  Sections in PostgreSQL: {final_stats['sections']}")
-    logger.info(f"  Vectors in Qdrant (documents): {final_stats['qdrant_documents']}")
-    logger.info(f"  Vectors in Qdrant (sections): {final_stats['qdrant_sections']}")
+    logger.info("  Documents in PostgreSQL: %s", final_stats['documents'])
+    logger.info("  Sections in PostgreSQL: %s", final_stats['sections'])
+    logger.info("  Vectors in Qdrant (documents): %s", final_stats['qdrant_documents'])
+    logger.info("  Vectors in Qdrant (sections): %s", final_stats['qdrant_sections'])
 
     logger.info("\n✓ Ingestion complete!")
 
@@ -6,8 +6,14 @@ Demonstrates orchestrator coordinating multiple agents for complex tasks
 
 import sys
 import asyncio
+import base64
+import hashlib
+import json
 import logging
+from array import array
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, List
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -31,6 +37,128 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Question embeddings shipped with the examples, so repeat runs skip Ollama
+PRESEED_PATH = Path(__file__).parent / "_preseed_embeddings.json"
+
+# Every question the examples embed (seed them all with --seed-embeddings)
+PRESEED_QUESTIONS = [
+    "What are the key building safety requirements?",
+    "What is the Buildings Ordinance?",
+    "What are building safety regulations?",
+    "What is Cap. 123?"
+]
+
+
+def _preseed_key(question: str) -> str:
+    """Preseed lookup key for a question"""
+    return hashlib.sha256(question.encode()).hexdigest()
+
+
+class PreseededOllamaService(OllamaService):
+    """
+    OllamaService that serves known question embeddings from the preseed file
+
+    A PRESEED_QUESTIONS embedding missing from the file is fetched from
+    Ollama once and recorded; save_preseed() writes it back, so the file
+    seeds itself on the first run.
+    """
+
+    def __init__(self, preseed_path: Path = PRESEED_PATH):
+        super().__init__()
+        self.preseed_path = preseed_path
+        self.preseed: Dict[str, List[float]] = {}
+        self._preseed_keys = {_preseed_key(question) for question in PRESEED_QUESTIONS}
+        self._unsaved = False
+
+        if preseed_path.exists():
+            data = json.loads(preseed_path.read_text())
+            # Vectors from a different embedding model would not match the collection
+            if data.get("model") == self.embedding_model:
+                for key, encoded in data.get("embeddings", {}).items():
+                    vector = array("f")
+                    vector.frombytes(base64.b64decode(encoded))
+                    self.preseed[key] = vector.tolist()
+
+        logger.info(f"Loaded {len(self.preseed)} preseeded embeddings")
+
+    async def embed(self, text: str) -> List[float]:
+        """Return the preseeded embedding if known, otherwise call Ollama"""
+        key = _preseed_key(text)
+        embedding = self.preseed.get(key)
+        if embedding is not None:
+            return embedding
+
+        embedding = await super().embed(text)
+        if key in self._preseed_keys:
+            self.preseed[key] = embedding
+            self._unsaved = True
+        return embedding
+
+    def save_preseed(self):
+        """Write the preseed file if new question embeddings were recorded"""
+        if not self._unsaved:
+            return
+
+        data = {
+            "model": self.embedding_model,
+            "embeddings": {
+                key: base64.b64encode(array("f", embedding).tobytes()).decode()
+                for key, embedding in self.preseed.items()
+            }
+        }
+        self.preseed_path.write_text(json.dumps(data, indent=2) + "\n")
+        self._unsaved = False
+
+        logger.info(f"Wrote {len(self.preseed)} embeddings to {self.preseed_path}")
+
+
+async def seed_embeddings(preseed_path: Path = PRESEED_PATH):
+    """
+    Embed every PRESEED_QUESTIONS entry missing from the preseed file and save it
+
+    Args:
+        preseed_path: Preseed JSON file
+    """
+    ollama = PreseededOllamaService(preseed_path)
+    try:
+        # embed() rather than embed_batch(): the preseed must hold exactly
+        # the vectors embed() returns
+        await asyncio.gather(*(ollama.embed(question) for question in PRESEED_QUESTIONS))
+        ollama.save_preseed()
+    finally:
+        await ollama.shutdown()
+
+
+@lru_cache(maxsize=1)
+def _get_services():
+    """
+    Create shared services once for all examples
+
+    Returns:
+        Tuple of (qdrant, ollama, rag)
+    """
+    qdrant = get_qdrant_client()
+    ollama = PreseededOllamaService()
+    rag = RAGService(SessionLocal, qdrant, ollama)
+    return qdrant, ollama, rag
+
+
+@lru_cache(maxsize=1)
+def _get_agents():
+    """
+    Create shared agent instances once for all examples
+
+    Returns:
+        Tuple of (legal_agent, analysis_agent, synthesis_agent, validation_agent)
+    """
+    _, ollama, rag = _get_services()
+    return (
+        LegalResearchAgent(ollama, rag),
+        AnalysisAgent(ollama),
+        SynthesisAgent(ollama),
+        ValidationAgent(ollama)
+    )
+
 
 async def example_1_comprehensive_legal_research():
     """
@@ -48,17 +176,8 @@ async def example_1_comprehensive_legal_research():
     print("EXAMPLE 1: Comprehensive Legal Research Workflow")
     print("="*70)
 
-    # Initialize services
-    db = SessionLocal()
-    qdrant = get_qdrant_client()
-    ollama = OllamaService()
-    rag = RAGService(db, qdrant, ollama)
-
-    # Initialize agents
-    legal_agent = LegalResearchAgent(ollama, rag)
-    analysis_agent = AnalysisAgent(ollama)
-    synthesis_agent = SynthesisAgent(ollama)
-    validation_agent = ValidationAgent(ollama)
+    # Shared agents (services are created once per process)
+    legal_agent, analysis_agent, synthesis_agent, validation_agent = _get_agents()
 
     # Create orchestrator
     orchestrator = WorkflowOrchestrator()
@@ -136,12 +255,13 @@ async def example_1_comprehensive_legal_research():
     print(f"Total Time: {result['execution_time']:.1f}s ({result['execution_time']/60:.1f} minutes)")
 
     if result["status"] == "completed":
-        print("\n📊 Task Results:")
-        for task_id, task_result in result["results"].items():
-            print(f"\n  {task_id.upper()}:")
-            print(f"    Agent: {task_result['agent']}")
-            print(f"    Duration: {task_result['duration']:.1f}s")
-            print(f"    Status: {task_result['result'].get('status', 'N/A')}")
+        # One log record for all tasks instead of a print per field
+        summary = "\n".join(
+            f"  {task_id}: {task_result['agent']} {task_result['duration']:.1f}s "
+            f"{task_result['result'].get('status', 'N/A')}"
+            for task_id, task_result in result["results"].items()
+        )
+        logger.info("Task summary:\n%s", summary)
 
         # Show validation results
         validation = result["results"]["validate"]["result"]
@@ -155,7 +275,6 @@ async def example_1_comprehensive_legal_research():
             for issue in validation['issues'][:3]:
                 print(f"      - {issue}")
 
-    db.close()
     print("\n✅ Example 1 complete!\n")
 
 
@@ -174,16 +293,8 @@ async def example_2_multi_source_comparison():
     print("EXAMPLE 2: Multi-Source Comparison Workflow")
     print("="*70)
 
-    # Initialize services
-    db = SessionLocal()
-    qdrant = get_qdrant_client()
-    ollama = OllamaService()
-    rag = RAGService(db, qdrant, ollama)
-
-    # Initialize agents
-    legal_agent = LegalResearchAgent(ollama, rag)
-    analysis_agent = AnalysisAgent(ollama)
-    synthesis_agent = SynthesisAgent(ollama)
+    # Shared agents (services are created once per process)
+    legal_agent, analysis_agent, synthesis_agent, _ = _get_agents()
 
     # Create orchestrator
     orchestrator = WorkflowOrchestrator()
@@ -194,23 +305,26 @@ async def example_2_multi_source_comparison():
     # Define workflow with parallel tasks
     workflow_definition = {
         "tasks": [
-            # Note: In a real implementation, you'd use orchestrator.execute_parallel_tasks()
-            # For this example, we show sequential but conceptually parallel queries
+            # Independent research queries run concurrently, then both feed "compare"
             {
-                "task_id": "research1",
-                "agent": "legal_research",
-                "input": {
-                    "question": "What is the Buildings Ordinance?",
-                    "top_k": 3
-                }
-            },
-            {
-                "task_id": "research2",
-                "agent": "legal_research",
-                "input": {
-                    "question": "What are building safety regulations?",
-                    "top_k": 3
-                }
+                "parallel": [
+                    {
+                        "task_id": "research1",
+                        "agent": "legal_research",
+                        "input": {
+                            "question": "What is the Buildings Ordinance?",
+                            "top_k": 3
+                        }
+                    },
+                    {
+                        "task_id": "research2",
+                        "agent": "legal_research",
+                        "input": {
+                            "question": "What are building safety regulations?",
+                            "top_k": 3
+                        }
+                    }
+                ]
             },
             {
                 "task_id": "compare",
@@ -260,12 +374,11 @@ async def example_2_multi_source_comparison():
     print(f"Total Time: {result['execution_time']:.1f}s")
 
     if result["status"] == "completed":
-        synthesis_result = result["results"]["synthesize"]["result"]
-        print(f"\n📝 Synthesized Output Preview:")
-        output = synthesis_result.get("synthesized_output", "")
-        print(f"   {output[:300]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            synthesis_result = result["results"]["synthesize"]["result"]
+            output = synthesis_result.get("synthesized_output", "")
+            logger.debug("Synthesized output preview:\n%s...", output[:300])
 
-    db.close()
     print("\n✅ Example 2 complete!\n")
 
 
@@ -281,15 +394,8 @@ async def example_3_simple_orchestration():
     print("EXAMPLE 3: Simple Research + Validation")
     print("="*70)
 
-    # Initialize services
-    db = SessionLocal()
-    qdrant = get_qdrant_client()
-    ollama = OllamaService()
-    rag = RAGService(db, qdrant, ollama)
-
-    # Initialize agents
-    legal_agent = LegalResearchAgent(ollama, rag)
-    validation_agent = ValidationAgent(ollama)
+    # Shared agents (services are created once per process)
+    legal_agent, _, _, validation_agent = _get_agents()
 
     # Create orchestrator
     orchestrator = WorkflowOrchestrator()
@@ -351,7 +457,6 @@ async def example_3_simple_orchestration():
     print(f"    Success Rate: {stats['success_rate']*100:.1f}%")
     print(f"    Avg Duration: {stats['avg_duration']:.1f}s")
 
-    db.close()
     print("\n✅ Example 3 complete!\n")
 
 
@@ -385,6 +490,12 @@ async def main():
         await example_3_simple_orchestration()
     except Exception as e:
         logger.error(f"Example failed: {e}", exc_info=True)
+    finally:
+        # Release the shared Ollama client, only if an example created it
+        if _get_services.cache_info().currsize:
+            _, ollama, _ = _get_services()
+            ollama.save_preseed()
+            await ollama.shutdown()
 
     print("\n" + "="*70)
     print("EXAMPLES COMPLETE")
@@ -396,4 +507,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if "--seed-embeddings" in sys.argv:
+        asyncio.run(seed_embeddings())
+    else:
+        asyncio.run(main())
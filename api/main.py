@@ -5,19 +5,23 @@ Multi-domain support: Legal, HR, Customer Service, and more
 Extensible architecture for adding custom domain agents
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional, Tuple
+import asyncio
 import logging
+import orjson
 import sys
 import os
 
 from services.ollama_service import OllamaService
 from services.rag_service import RAGService
-from database import init_db, get_db
+from services.semantic_cache import SemanticCache
+from database import SessionLocal, init_db
 from qdrant_client import QdrantClient
 from routes import agents as agent_routes
 from routes import workflows as workflow_routes
@@ -33,13 +37,84 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+async def _background_init(app: FastAPI):
+    """
+    Warm up dependencies after the server starts accepting connections
+
+    Sets app.state.ready only if every step succeeded; otherwise the
+    failures are kept in app.state.init_errors for /health to report.
+    """
+    errors = {}
+
+    # Initialize database (blocking DDL - run off the event loop)
+    try:
+        await asyncio.to_thread(init_db)
+        logger.info("Database initialized")
+    except Exception as e:
+        logger.error(f"Database initialization failed: {e}")
+        errors["database"] = str(e)
+
+    # Register system and custom workflows (custom ones are read from the tables above)
+    try:
+        await workflow_routes.load_all_workflows()
+    except Exception as e:
+        logger.error(f"Workflow registration failed: {e}")
+        errors["workflows"] = str(e)
+
+    # Check Qdrant is reachable over gRPC
+    try:
+        collections = await asyncio.to_thread(qdrant_client.get_collections)
+        logger.info(f"Qdrant connected ({len(collections.collections)} collections)")
+    except Exception as e:
+        logger.error(f"Qdrant connection failed: {e}")
+        errors["qdrant"] = str(e)
+
+    # Check Ollama connection (may wait on a cold model)
+    try:
+        app.state.ollama_health = await ollama_service.health_check()
+        logger.info(f"Ollama status: {app.state.ollama_health}")
+    except Exception as e:
+        logger.error(f"Ollama health check failed: {e}")
+        errors["ollama"] = str(e)
+
+    app.state.init_errors = errors
+    app.state.ready = not errors
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize application on startup and release resources on shutdown"""
+    logger.info("Starting Vault AI Platform API...")
+
+    app.state.ready = False
+    app.state.init_errors = None  # Set by _background_init when it finishes
+    app.state.ollama_health = None
+
+    # Open the shared Ollama HTTP client; dependency warm-up runs in the background
+    await ollama_service.startup()
+
+    # Build the agents and orchestrator up front so no request pays for it
+    agent_routes.configure_services(ollama_service, qdrant_client)
+    app.state.agent_registry, app.state.orchestrator = await agent_routes.get_agent_registry()
+
+    init_task = asyncio.create_task(_background_init(app))
+    batcher = asyncio.create_task(_embed_batcher_loop())
+
+    yield
+
+    init_task.cancel()
+    batcher.cancel()
+    await ollama_service.shutdown()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Vault AI Platform API",
     description="Multi-domain agentic AI platform with specialized agents for Legal, HR, Customer Service, and more. Extensible workflow orchestration powered by local LLMs.",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -63,7 +138,68 @@ ollama_service = OllamaService()
 # Initialize Qdrant client
 qdrant_host = os.getenv("QDRANT_HOST", "localhost")
 qdrant_port = int(os.getenv("QDRANT_PORT", "6333"))
-qdrant_client = QdrantClient(host=qdrant_host, port=qdrant_port)
+qdrant_grpc_port = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+qdrant_client = QdrantClient(
+    host=qdrant_host,
+    port=qdrant_port,
+    grpc_port=qdrant_grpc_port,
+    prefer_grpc=True,
+    timeout=10
+)
+
+# Semantic response cache for /api/rag and /api/generate
+semantic_cache = SemanticCache(qdrant_client, ollama_service)
+
+# Micro-batching for /api/embed: requests arriving within EMBED_BATCH_WINDOW
+# seconds of each other share one Ollama call
+EMBED_BATCH_WINDOW = float(os.getenv("EMBED_BATCH_WINDOW_MS", "5")) / 1000
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "32"))
+_embed_queue: "asyncio.Queue[Tuple[str, asyncio.Future]]" = asyncio.Queue()
+
+
+async def _embed_batch(items: List[Tuple[str, asyncio.Future]]):
+    """Embed one coalesced batch and resolve its waiters"""
+    try:
+        embeddings = await ollama_service.embed_batch([text for text, _ in items])
+        for (_, future), embedding in zip(items, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+    except Exception as e:
+        for _, future in items:
+            if not future.done():
+                future.set_exception(e)
+
+
+async def _embed_batcher_loop():
+    """Drain the embed queue, coalescing concurrent requests into batched calls"""
+    loop = asyncio.get_running_loop()
+    in_flight = set()  # Strong references to dispatched batches
+
+    while True:
+        items: List[Tuple[str, asyncio.Future]] = [await _embed_queue.get()]
+        deadline = loop.time() + EMBED_BATCH_WINDOW
+
+        while len(items) < EMBED_BATCH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                items.append(await asyncio.wait_for(_embed_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        # Don't wait for Ollama before collecting the next batch - several batches
+        # may be in flight (OllamaService bounds the concurrency)
+        task = asyncio.create_task(_embed_batch(items))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+
+async def _embed_batched(text: str) -> List[float]:
+    """Queue a text for the embed batcher and wait for its embedding"""
+    future = asyncio.get_running_loop().create_future()
+    await _embed_queue.put((text, future))
+    return await future
 
 
 # Pydantic models
@@ -90,28 +226,29 @@ class RAGRequest(BaseModel):
     min_score: float = 0.5
 
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Initialize application on startup"""
-    logger.info("Starting Vault AI Platform API...")
-
-    # Initialize database
-    try:
-        init_db()
-        logger.info("Database initialized")
-    except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
-
-    # Check Ollama connection
-    health = await ollama_service.health_check()
-    logger.info(f"Ollama status: {health}")
-
-
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    """System health check"""
+    """System health check (503 until background initialization has succeeded)"""
+    if app.state.init_errors:
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "failed",
+                "errors": app.state.init_errors,
+                "ollama": app.state.ollama_health
+            }
+        )
+
+    if not app.state.ready:
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "starting",
+                "ollama": app.state.ollama_health
+            }
+        )
+
     try:
         ollama_health = await ollama_service.health_check()
 
@@ -170,12 +307,18 @@ async def generate_text(request: GenerateRequest):
     ```
     """
     try:
-        result = await ollama_service.generate(
-            prompt=request.prompt,
-            system_prompt=request.system_prompt,
-            temperature=request.temperature,
-            max_tokens=request.max_tokens
-        )
+        cache_scope = f"generate:{ollama_service.model}:{request.temperature}:{request.max_tokens}"
+        cache_text = f"{request.system_prompt or ''}\n{request.prompt}"
+        embedding, result = await semantic_cache.lookup(cache_text, cache_scope)
+
+        if result is None:
+            result = await ollama_service.generate(
+                prompt=request.prompt,
+                system_prompt=request.system_prompt,
+                temperature=request.temperature,
+                max_tokens=request.max_tokens
+            )
+            await semantic_cache.store(embedding, cache_text, cache_scope, result)
 
         return {
             "success": True,
@@ -193,12 +336,65 @@ async def generate_text(request: GenerateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Streaming text generation endpoint
+@app.post("/api/generate/stream")
+async def generate_text_stream(request: GenerateRequest):
+    """
+    Generate text using llama3.3:70b, streaming tokens as they are produced
+
+    Returns Ollama's NDJSON chat stream: one JSON object per line, the last
+    one with "done": true and timing statistics. A failure after streaming
+    has started ends the stream with an {"error": ...} line.
+
+    Example:
+    ```
+    curl -N -X POST http://localhost:8000/api/generate/stream \
+      -H "Content-Type: application/json" \
+      -d '{"prompt": "Explain contract law in Hong Kong", "max_tokens": 500}'
+    ```
+    """
+    stream = ollama_service.generate_stream(
+        prompt=request.prompt,
+        system_prompt=request.system_prompt,
+        temperature=request.temperature,
+        max_tokens=request.max_tokens
+    )
+
+    # Wait for the first line before sending headers, so a failed Ollama
+    # request is reported as an HTTP error rather than an empty 200 stream
+    try:
+        first_line = await anext(stream)
+    except StopAsyncIteration:
+        raise HTTPException(status_code=500, detail="Ollama returned an empty stream")
+    except Exception as e:
+        logger.error(f"Generation error: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def body():
+        yield first_line
+        try:
+            async for line in stream:
+                yield line
+        except Exception as e:
+            # Headers are already sent - report the failure in-band, as Ollama does
+            logger.error(f"Generation stream error: {e}", exc_info=True)
+            yield orjson.dumps({"error": str(e)}) + b"\n"
+        finally:
+            await stream.aclose()
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
 # Embedding endpoint
 @app.post("/api/embed")
 async def generate_embedding(request: EmbedRequest):
     """
     Generate embeddings using nomic-embed-text
 
+    Vectors come from Ollama's /api/embed (batched with concurrent requests),
+    which returns them L2-normalized - unlike OllamaService.embed() on the
+    legacy /api/embeddings endpoint. Cosine similarities are the same either way.
+
     Example:
     ```
     curl -X POST http://localhost:8000/api/embed \
@@ -207,7 +403,7 @@ async def generate_embedding(request: EmbedRequest):
     ```
     """
     try:
-        embedding = await ollama_service.embed(request.text)
+        embedding = await _embed_batched(request.text)
 
         return {
             "success": True,
@@ -244,12 +440,15 @@ async def rag_query(request: RAGRequest):
     ```
     """
     try:
-        # Get database session
-        db = next(get_db())
+        # Serve semantically equivalent questions from the cache
+        cache_scope = f"rag:{request.search_type}:{request.top_k}:{request.min_score}"
+        query_embedding, cached = await semantic_cache.lookup(request.question, cache_scope)
+        if cached is not None:
+            return cached
 
         # Create RAG service instance
         rag_service = RAGService(
-            db_session=db,
+            session_factory=SessionLocal,
             qdrant_client=qdrant_client,
             ollama_service=ollama_service
         )
@@ -259,9 +458,13 @@ async def rag_query(request: RAGRequest):
             question=request.question,
             top_k=request.top_k,
             search_type=request.search_type,
-            min_score=request.min_score
+            min_score=request.min_score,
+            query_embedding=query_embedding
         )
 
+        if result.get("success"):
+            await semantic_cache.store(query_embedding, request.question, cache_scope, result)
+
         return result
 
     except Exception as e:
@@ -0,0 +1,38 @@
+"""
+Alembic environment - runs the schema migrations in versions/
+
+init_db() only creates missing tables. Changes to existing tables are
+revisions here, applied explicitly with `alembic upgrade head`. Each
+revision checks the live schema first, so it is a no-op on a database
+that create_all() built at the current model version.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+
+from database import Base, engine
+import models  # noqa: F401 - registers every table on Base.metadata
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_online():
+    """Run the migrations on a connection from the application's engine"""
+    with engine.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    # The revisions inspect the live schema and convert existing rows
+    raise RuntimeError("Offline (--sql) mode is not supported; run the migrations against the database")
+
+run_migrations_online()
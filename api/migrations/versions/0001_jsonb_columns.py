@@ -0,0 +1,50 @@
+"""Store JSON columns as JSONB and add GIN indexes on tags and metadata_json
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Columns created as json by older versions
+JSON_COLUMNS = {
+    'custom_workflows': ('steps', 'input_schema', 'tags'),
+    'hk_legal_documents': ('metadata_json',),
+    'hk_legal_sections': ('subsections_json',),
+}
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    for table, column_names in JSON_COLUMNS.items():
+        existing = {col['name']: col['type'] for col in inspector.get_columns(table)}
+        for column in column_names:
+            if column in existing and not isinstance(existing[column], JSONB):
+                op.alter_column(table, column, type_=JSONB, postgresql_using=f'{column}::jsonb')
+
+    op.create_index('idx_workflow_tags_gin', 'custom_workflows', ['tags'],
+                    postgresql_using='gin', if_not_exists=True)
+    op.create_index('idx_doc_metadata_gin', 'hk_legal_documents', ['metadata_json'],
+                    postgresql_using='gin', if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('idx_doc_metadata_gin', table_name='hk_legal_documents', if_exists=True)
+    op.drop_index('idx_workflow_tags_gin', table_name='custom_workflows', if_exists=True)
+
+    inspector = sa.inspect(op.get_bind())
+
+    for table, column_names in JSON_COLUMNS.items():
+        existing = {col['name'] for col in inspector.get_columns(table)}
+        for column in column_names:
+            if column in existing:
+                op.alter_column(table, column, type_=sa.JSON, postgresql_using=f'{column}::json')
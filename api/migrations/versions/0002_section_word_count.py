@@ -0,0 +1,26 @@
+"""Add hk_legal_sections.word_count
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = {col['name'] for col in sa.inspect(op.get_bind()).get_columns('hk_legal_sections')}
+
+    # Nullable: existing sections get a count when they are next imported
+    if 'word_count' not in columns:
+        op.add_column('hk_legal_sections', sa.Column('word_count', sa.Integer))
+
+
+def downgrade():
+    op.drop_column('hk_legal_sections', 'word_count')
@@ -0,0 +1,29 @@
+"""Replace idx_active_category with the partial covering idx_active_workflows_category
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index('idx_active_category', table_name='custom_workflows', if_exists=True)
+    op.create_index(
+        'idx_active_workflows_category', 'custom_workflows', ['category', 'created_at'],
+        postgresql_where=sa.text('is_active'),
+        postgresql_include=['name', 'workflow_id'],
+        if_not_exists=True
+    )
+
+
+def downgrade():
+    op.drop_index('idx_active_workflows_category', table_name='custom_workflows', if_exists=True)
+    op.create_index('idx_active_category', 'custom_workflows', ['is_active', 'category'], if_not_exists=True)
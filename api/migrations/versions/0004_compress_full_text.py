@@ -0,0 +1,51 @@
+"""Move hk_legal_documents.full_text into the zstd-compressed full_text_zstd column
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from models.hk_legal_document import compress_text
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 200
+
+
+def upgrade():
+    conn = op.get_bind()
+    columns = {col['name'] for col in sa.inspect(conn).get_columns('hk_legal_documents')}
+
+    if 'full_text' not in columns:
+        return
+
+    if 'full_text_zstd' not in columns:
+        op.add_column('hk_legal_documents', sa.Column('full_text_zstd', sa.LargeBinary))
+
+    # Convert in batches so a large corpus is never held in memory at once
+    while True:
+        rows = conn.execute(sa.text(
+            "SELECT id, full_text FROM hk_legal_documents "
+            "WHERE full_text_zstd IS NULL ORDER BY id LIMIT :limit"
+        ), {"limit": BATCH_SIZE}).fetchall()
+
+        if not rows:
+            break
+
+        conn.execute(
+            sa.text("UPDATE hk_legal_documents SET full_text_zstd = :data WHERE id = :id"),
+            [{"id": row.id, "data": compress_text(row.full_text or "")} for row in rows]
+        )
+
+    op.alter_column('hk_legal_documents', 'full_text_zstd', nullable=False)
+    op.drop_column('hk_legal_documents', 'full_text')
+
+
+def downgrade():
+    raise NotImplementedError("full_text is not restored; reimport the documents instead")
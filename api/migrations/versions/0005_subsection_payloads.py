@@ -0,0 +1,81 @@
+"""Move hk_legal_sections.subsections_json into the shared hk_legal_subsection_payloads table
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import orjson
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+from models.hk_legal_subsection_payload import payload_hash
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    if not inspector.has_table('hk_legal_subsection_payloads'):
+        op.create_table(
+            'hk_legal_subsection_payloads',
+            sa.Column('id', sa.Integer, primary_key=True),
+            sa.Column('hash', sa.String(32), nullable=False),
+            sa.Column('payload', JSONB, nullable=False)
+        )
+        op.create_index('ix_hk_legal_subsection_payloads_hash', 'hk_legal_subsection_payloads',
+                        ['hash'], unique=True)
+
+    columns = {col['name'] for col in inspector.get_columns('hk_legal_sections')}
+
+    if 'subsection_payload_id' not in columns:
+        op.add_column('hk_legal_sections', sa.Column(
+            'subsection_payload_id', sa.Integer, sa.ForeignKey('hk_legal_subsection_payloads.id')
+        ))
+    op.create_index('ix_hk_legal_sections_subsection_payload_id', 'hk_legal_sections',
+                    ['subsection_payload_id'], if_not_exists=True)
+
+    if 'subsections_json' not in columns:
+        return
+
+    last_id = 0
+    while True:
+        rows = conn.execute(sa.text(
+            "SELECT id, subsections_json FROM hk_legal_sections "
+            "WHERE id > :last_id ORDER BY id LIMIT :limit"
+        ), {"last_id": last_id, "limit": BATCH_SIZE}).fetchall()
+
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        # Empty arrays are not stored (subsection_payload_id stays NULL)
+        hashed = [(row.id, payload_hash(row.subsections_json), row.subsections_json)
+                  for row in rows if row.subsections_json]
+        if not hashed:
+            continue
+
+        conn.execute(
+            sa.text("INSERT INTO hk_legal_subsection_payloads (hash, payload) "
+                    "VALUES (:hash, CAST(:payload AS jsonb)) ON CONFLICT (hash) DO NOTHING"),
+            [{"hash": key, "payload": orjson.dumps(payload).decode()} for _, key, payload in hashed]
+        )
+        conn.execute(
+            sa.text("UPDATE hk_legal_sections SET subsection_payload_id = p.id "
+                    "FROM hk_legal_subsection_payloads p WHERE hk_legal_sections.id = :id AND p.hash = :hash"),
+            [{"id": section_id, "hash": key} for section_id, key, _ in hashed]
+        )
+
+    op.drop_column('hk_legal_sections', 'subsections_json')
+
+
+def downgrade():
+    raise NotImplementedError("subsections_json is not restored; reimport the documents instead")
@@ -4,10 +4,14 @@ Database models for Legal AI Vault
 
 from .hk_legal_document import HKLegalDocument
 from .hk_legal_section import HKLegalSection
+from .hk_legal_subsection_payload import HKLegalSubsectionPayload
 from .custom_workflow import CustomWorkflow
+from .embedding_cache import EmbeddingCache
 
 __all__ = [
     'HKLegalDocument',
     'HKLegalSection',
-    'CustomWorkflow'
+    'HKLegalSubsectionPayload',
+    'CustomWorkflow',
+    'EmbeddingCache'
 ]
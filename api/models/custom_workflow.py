@@ -2,7 +2,8 @@
 Database model for custom user-created workflows
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
 from database import Base
 
@@ -20,8 +21,8 @@ class CustomWorkflow(Base):
     name = Column(String(200), nullable=False)  # Display name: "Legal Compliance Check"
     description = Column(Text)  # Human-readable description
 
-    # Workflow definition (stored as JSON)
-    steps = Column(JSON, nullable=False)  # Array of step definitions
+    # Workflow definition (stored as JSONB)
+    steps = Column(JSONB, nullable=False)  # Array of step definitions
     # Example step structure:
     # {
     #     "name": "legal_research",
@@ -35,7 +36,7 @@ class CustomWorkflow(Base):
     # }
 
     # Input schema (defines what fields the workflow expects)
-    input_schema = Column(JSON)  # JSON schema for form validation
+    input_schema = Column(JSONB)  # JSON schema for form validation
     # Example:
     # {
     #     "fields": [
@@ -46,7 +47,7 @@ class CustomWorkflow(Base):
 
     # Workflow metadata
     category = Column(String(50), index=True)  # e.g., "legal", "hr", "cs", "general"
-    tags = Column(JSON)  # Array of tags: ["compliance", "legal", "hr"]
+    tags = Column(JSONB)  # Array of tags: ["compliance", "legal", "hr"]
     is_active = Column(Boolean, default=True, index=True)  # Enable/disable workflow
     is_system = Column(Boolean, default=False, index=True)  # True for pre-built workflows
 
@@ -63,15 +64,23 @@ class CustomWorkflow(Base):
 
     # Indexes for common queries
     __table_args__ = (
-        Index('idx_active_category', 'is_active', 'category'),
+        # Listing query: active workflows by category, newest first. Partial index
+        # (active rows only) that also carries the summary's name/workflow_id
+        Index(
+            'idx_active_workflows_category',
+            'category', 'created_at',
+            postgresql_where=text('is_active'),
+            postgresql_include=['name', 'workflow_id']
+        ),
         Index('idx_created_at', 'created_at'),
+        Index('idx_workflow_tags_gin', 'tags', postgresql_using='gin'),  # tags @> '["hr"]'
     )
 
     def __repr__(self):
         return f"<CustomWorkflow(workflow_id='{self.workflow_id}', name='{self.name}')>"
 
     def to_dict(self):
-        """Convert to dictionary for API responses"""
+        """Convert to dictionary for API responses (datetimes are serialized by the response encoder)"""
         return {
             'id': self.id,
             'workflow_id': self.workflow_id,
@@ -84,14 +93,14 @@ class CustomWorkflow(Base):
             'is_active': self.is_active,
             'is_system': self.is_system,
             'execution_count': self.execution_count,
-            'last_executed': self.last_executed.isoformat() if self.last_executed else None,
+            'last_executed': self.last_executed,
             'created_by': self.created_by,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
     def to_workflow_summary(self):
-        """Convert to summary format for workflow listings"""
+        """Convert to summary format for workflow listings (datetimes are serialized by the response encoder)"""
         return {
             'id': self.workflow_id,
             'name': self.name,
@@ -101,5 +110,5 @@ class CustomWorkflow(Base):
             'step_count': len(self.steps) if self.steps else 0,
             'is_system': self.is_system,
             'execution_count': self.execution_count,
-            'last_executed': self.last_executed.isoformat() if self.last_executed else None
+            'last_executed': self.last_executed
         }
@@ -0,0 +1,26 @@
+"""
+Database model for cached text embeddings
+"""
+
+from sqlalchemy import Column, String
+from sqlalchemy.dialects.postgresql import ARRAY, REAL
+import hashlib
+from database import Base
+
+
+def embedding_key(model: str, text: str) -> str:
+    """Cache key for an embedding (SHA-256 over model name and text)"""
+    return hashlib.sha256(f"{model}\x00{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache(Base):
+    """Embedding vectors keyed by content hash - embeddings are a pure function of model + text"""
+
+    __tablename__ = "embedding_cache"
+
+    hash = Column(String(64), primary_key=True)  # embedding_key(model, text)
+    model = Column(String(200), nullable=False)  # Embedding model that produced the vector
+    vector = Column(ARRAY(REAL), nullable=False)
+
+    def __repr__(self):
+        return f"<EmbeddingCache(hash='{self.hash}', model='{self.model}')>"
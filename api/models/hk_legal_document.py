@@ -2,11 +2,34 @@
 Database models for Hong Kong legal documents
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index, LargeBinary
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
+from typing import Optional
+import threading
+import zstandard as zstd
 from database import Base
 
+# zstd contexts are not safe to share between threads
+_zstd_local = threading.local()
+
+
+def compress_text(value: str) -> bytes:
+    """Compress text with zstd (level 3)"""
+    if not hasattr(_zstd_local, "cctx"):
+        _zstd_local.cctx = zstd.ZstdCompressor(level=3)
+    return _zstd_local.cctx.compress(value.encode('utf-8'))
+
+
+def decompress_text(data: Optional[bytes]) -> Optional[str]:
+    """Decompress text written by compress_text"""
+    if data is None:
+        return None
+    if not hasattr(_zstd_local, "dctx"):
+        _zstd_local.dctx = zstd.ZstdDecompressor()
+    return _zstd_local.dctx.decompress(data).decode('utf-8')
+
 
 class HKLegalDocument(Base):
     """Model for HK legal documents (ordinances and subsidiary legislation)"""
@@ -32,9 +55,13 @@ class HKLegalDocument(Base):
 
     # Content
     title = Column(Text)  # Short title
-    long_title = Column(Text)  # Full official title
-    preamble = Column(Text)  # Preamble text
-    full_text = Column(Text, nullable=False)  # Complete document text
+    # Large columns are deferred (loaded on first access, or with undefer()/undefer_group())
+    long_title = deferred(Column(Text), group='long_text')  # Full official title
+    preamble = deferred(Column(Text), group='long_text')  # Preamble text
+    full_text_compressed = deferred(
+        Column("full_text_zstd", LargeBinary, nullable=False),
+        group='full_text'
+    )  # Complete document text (zstd)
 
     # Statistics
     total_sections = Column(Integer, default=0)  # Number of sections
@@ -45,7 +72,7 @@ class HKLegalDocument(Base):
 
     # Source and processing
     source_file = Column(String(500))  # Path to source XML file
-    metadata_json = Column(JSON)  # Additional metadata as JSON
+    metadata_json = Column(JSONB)  # Additional metadata as JSONB
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -53,6 +80,8 @@ class HKLegalDocument(Base):
     imported_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
+    # Load with selectinload(HKLegalDocument.sections) when iterating many documents:
+    # one IN query on document_id instead of N lazy loads or a join repeating full_text
     sections = relationship("HKLegalSection", back_populates="document", cascade="all, delete-orphan")
 
     # Indexes for common queries
@@ -60,13 +89,23 @@ class HKLegalDocument(Base):
         Index('idx_doc_category_status', 'category', 'doc_status'),
         Index('idx_effective_date', 'effective_date'),
         Index('idx_language_category', 'language', 'category'),
+        Index('idx_doc_metadata_gin', 'metadata_json', postgresql_using='gin'),
     )
 
+    @property
+    def full_text(self) -> Optional[str]:
+        """Complete document text (decompressed on access)"""
+        return decompress_text(self.full_text_compressed)
+
+    @full_text.setter
+    def full_text(self, value: Optional[str]):
+        self.full_text_compressed = compress_text(value) if value is not None else None
+
     def __repr__(self):
         return f"<HKLegalDocument(doc_number='{self.doc_number}', doc_name='{self.doc_name}')>"
 
     def to_dict(self):
-        """Convert to dictionary for API responses"""
+        """Convert to dictionary for API responses (datetimes are serialized by the response encoder)"""
         return {
             'id': self.id,
             'doc_number': self.doc_number,
@@ -75,12 +114,12 @@ class HKLegalDocument(Base):
             'category': self.category,
             'doc_type': self.doc_type,
             'doc_status': self.doc_status,
-            'effective_date': self.effective_date.isoformat() if self.effective_date else None,
+            'effective_date': self.effective_date,
             'language': self.language,
             'title': self.title,
             'long_title': self.long_title,
             'total_sections': self.total_sections,
             'word_count': self.word_count,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
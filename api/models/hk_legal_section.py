@@ -2,7 +2,7 @@
 Database model for sections within HK legal documents
 """
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index, JSON, event
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index, event
 from sqlalchemy.orm import relationship, validates
 from database import Base
 
@@ -26,16 +26,19 @@ class HKLegalSection(Base):
     # Content
     heading = Column(Text)  # Section heading/title
     content = Column(Text, nullable=False)  # Full section text
+    word_count = Column(Integer)  # Word count, computed at parse time
 
     # Hierarchy
     has_subsections = Column(Integer, default=0)  # Boolean flag stored as Integer (0 or 1)
-    subsections_json = Column(JSON)  # Array of subsection data
+    # Subsections array, stored once per distinct payload (NULL when there are none)
+    subsection_payload_id = Column(Integer, ForeignKey('hk_legal_subsection_payloads.id'), index=True)
 
     # Vector embedding reference
     qdrant_id = Column(String(100), index=True)  # UUID in Qdrant for this section
 
     # Relationship
     document = relationship("HKLegalDocument", back_populates="sections")
+    subsection_payload = relationship("HKLegalSubsectionPayload")
 
     @validates('has_subsections')
     def validate_has_subsections(self, key, value):
@@ -62,6 +65,7 @@ class HKLegalSection(Base):
             'section_number': self.section_number,
             'heading': self.heading,
             'content': self.content,
+            'word_count': self.word_count,
             'has_subsections': bool(self.has_subsections),
-            'subsections': self.subsections_json
+            'subsections': self.subsection_payload.payload if self.subsection_payload is not None else []
         }
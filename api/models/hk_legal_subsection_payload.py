@@ -0,0 +1,29 @@
+"""
+Database model for subsection payloads shared between HK legal sections
+"""
+
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from typing import List, Dict
+import hashlib
+import orjson
+from database import Base
+
+
+def payload_hash(payload: List[Dict]) -> str:
+    """Content hash of a subsections payload (blake2b-128 over canonical JSON)"""
+    canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+class HKLegalSubsectionPayload(Base):
+    """Content-addressed subsections array - each distinct payload is stored once"""
+
+    __tablename__ = "hk_legal_subsection_payloads"
+
+    id = Column(Integer, primary_key=True)
+    hash = Column(String(32), unique=True, index=True, nullable=False)  # payload_hash(payload)
+    payload = Column(JSONB, nullable=False)  # Array of subsection data
+
+    def __repr__(self):
+        return f"<HKLegalSubsectionPayload(id={self.id}, hash='{self.hash}')>"
@@ -2,6 +2,7 @@
 Parsers for various legal document formats
 """
 
+from ._types import ParsedSection, ParsedSubsection
 from .hk_legal_xml_parser import HKLegalXMLParser
 
-__all__ = ['HKLegalXMLParser']
+__all__ = ['HKLegalXMLParser', 'ParsedSection', 'ParsedSubsection']
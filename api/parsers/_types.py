@@ -0,0 +1,61 @@
+"""
+Intermediate records produced by the HK legal XML parser
+
+Sections are by far the most numerous objects a batch parse creates, so they
+are slotted dataclasses rather than dicts. They are converted to plain dicts
+only where they leave the parser (JSONB columns, API responses).
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+
+@dataclass(slots=True)
+class ParsedSubsection:
+    """A subsection of a parsed section"""
+
+    subsection_id: str
+    subsection_name: str
+    subsection_number: str
+    content: str
+
+    def to_dict(self) -> Dict:
+        return {
+            'subsection_id': self.subsection_id,
+            'subsection_name': self.subsection_name,
+            'subsection_number': self.subsection_number,
+            'content': self.content
+        }
+
+
+@dataclass(slots=True)
+class ParsedSection:
+    """A section of a parsed document"""
+
+    section_id: str
+    section_name: str
+    section_number: str
+    heading: str
+    content: str
+    word_count: int
+    subsections: Tuple[ParsedSubsection, ...]
+
+    @property
+    def has_subsections(self) -> bool:
+        return len(self.subsections) > 0
+
+    def subsections_json(self) -> List[Dict]:
+        """Subsections as JSON-serializable dicts (HKLegalSubsectionPayload.payload)"""
+        return [subsection.to_dict() for subsection in self.subsections]
+
+    def to_dict(self) -> Dict:
+        return {
+            'section_id': self.section_id,
+            'section_name': self.section_name,
+            'section_number': self.section_number,
+            'heading': self.heading,
+            'content': self.content,
+            'word_count': self.word_count,
+            'subsections': self.subsections_json(),
+            'has_subsections': self.has_subsections
+        }
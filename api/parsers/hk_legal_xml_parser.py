@@ -3,26 +3,103 @@ Parser for Hong Kong e-Legislation XML files
 Handles both ordinances and subsidiary legislation
 """
 
-import xml.etree.ElementTree as ET
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from lxml import etree
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import logging
+import os
 import re
+import sys
+
+from ._types import ParsedSection, ParsedSubsection
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r'\s+')
+
+# Dates in document metadata (YYYY-MM-DD, optionally followed by a time)
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+# Cap references: Cap. 123, Cap 123
+_CAP_RE = re.compile(r'Cap\.?\s*(\d+[A-Z]?)', re.IGNORECASE)
+
+# Short, low-cardinality values ("s1", "(1)", "en", "In Force") repeat across
+# the corpus; interning keeps one string object per distinct value
+_intern = sys.intern
+_INTERNED_META_FIELDS = frozenset({'doc_type', 'doc_status', 'language'})
+
+# Separates texts in extract_references_batch (never part of a match)
+_BATCH_SEP = '\x00'
+
+# XML namespaces used in HK legal documents
+NAMESPACES = {
+    'law': 'http://www.xml.gov.hk/schemas/hklm/1.0',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'dcterms': 'http://purl.org/dc/terms/',
+    'xhtml': 'http://www.w3.org/1999/xhtml'
+}
+
+
+LAW_NS = NAMESPACES['law']
+
+# Clark-notation tags for the per-section hot path (no prefix resolution per call)
+_SECTION = f'{{{LAW_NS}}}section'
+_SUBSECTION = f'{{{LAW_NS}}}subsection'
+_NUM = f'{{{LAW_NS}}}num'
+_HEADING = f'{{{LAW_NS}}}heading'
+
+_SECTION_TAGS = (_SECTION, 'section')
+
+
+def _word_count(text: Optional[str]) -> int:
+    """Word count of whitespace-normalized text (counts separators, no list allocation)"""
+    return text.count(' ') + 1 if text else 0
+
+
+def _xpath(prefixed: str, fallback: str) -> Tuple[etree.XPath, etree.XPath]:
+    """Compile a namespaced XPath and its no-namespace fallback"""
+    return etree.XPath(prefixed, namespaces=NAMESPACES), etree.XPath(fallback)
+
 
 class HKLegalXMLParser:
     """Parser for HK e-Legislation XML format"""
 
-    # XML namespaces used in HK legal documents
-    NAMESPACES = {
-        'law': 'http://www.xml.gov.hk/schemas/hklm/1.0',
-        'dc': 'http://purl.org/dc/elements/1.1/',
-        'dcterms': 'http://purl.org/dc/terms/',
-        'xhtml': 'http://www.w3.org/1999/xhtml'
+    # Kept on the class for existing callers
+    NAMESPACES = NAMESPACES
+
+    # Compiled XPath plan: (namespaced, no-namespace fallback)
+    _XP_MAIN = _xpath('law:main', 'main')
+    _XP_META = _xpath('law:meta', 'meta')
+    _XP_DOC_TITLE = _xpath('law:docTitle', 'docTitle')
+    _XP_LONG_TITLE = _xpath('law:longTitle', 'longTitle')
+    _XP_PREAMBLE = _xpath('law:preamble', 'preamble')
+
+    # Metadata fields: key -> compiled XPath pair
+    _XP_META_FIELDS = {
+        'doc_name': _xpath('law:docName', 'docName'),
+        'doc_type': _xpath('law:docType', 'docType'),
+        'doc_number': _xpath('law:docNumber', 'docNumber'),
+        'doc_status': _xpath('law:docStatus', 'docStatus'),
+        # Dublin Core metadata
+        'identifier': _xpath('dc:identifier', 'identifier'),
+        'date': _xpath('dc:date', 'date'),
+        'title': _xpath('dc:title', 'title'),
+        'language': _xpath('dc:language', 'language'),
+        'publisher': _xpath('dc:publisher', 'publisher')
     }
 
+    # Drop whitespace-only text, comments and PIs at parse time
+    _PARSE_OPTIONS = dict(
+        huge_tree=True,
+        collect_ids=False,
+        remove_blank_text=True,
+        remove_comments=True,
+        remove_pis=True
+    )
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
 
@@ -37,18 +114,17 @@ class HKLegalXMLParser:
             Dict containing parsed document data, or None if parsing fails
         """
         try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
+            root, streamed_sections = self._stream_sections(xml_path)
 
             # Determine document type
             doc_type = root.tag.split('}')[-1]  # Remove namespace
 
             if doc_type == 'ordinance':
-                return self._parse_ordinance(root, xml_path)
+                return self._parse_ordinance(root, xml_path, streamed_sections)
             elif doc_type == 'subLeg':
-                return self._parse_subsidiary_legislation(root, xml_path)
+                return self._parse_subsidiary_legislation(root, xml_path, streamed_sections)
             elif doc_type == 'lawDoc':
-                return self._parse_law_document(root, xml_path)
+                return self._parse_law_document(root, xml_path, streamed_sections)
             else:
                 self.logger.warning(f"Unknown document type: {doc_type} in {xml_path}")
                 return None
@@ -57,19 +133,89 @@ class HKLegalXMLParser:
             self.logger.error(f"Failed to parse {xml_path}: {e}", exc_info=True)
             return None
 
-    def _parse_ordinance(self, root: ET.Element, xml_path: str) -> Dict:
+    @staticmethod
+    def _find_child(element: etree._Element, tag: str, plain_tag: str) -> Optional[etree._Element]:
+        """Find a direct child by namespaced tag, trying the plain tag only on a miss"""
+        child = element.find(tag)
+        return child if child is not None else element.find(plain_tag)
+
+    def _stream_sections(self, xml_path: str) -> Tuple[etree._Element, List[Tuple]]:
+        """
+        Parse a file, extracting sections as they complete
+
+        Each section's subtree is released right after extraction and replaced
+        by its plain text, so the tree kept for metadata and full_text holds a
+        single text node per section instead of the section's markup.
+
+        Args:
+            xml_path: Path to XML file
+
+        Returns:
+            Tuple of (root element, [(top-level ancestor, namespaced, section dict)])
+            with sections in document order
+        """
+        sections: List[Optional[Tuple]] = []
+        open_sections: List[int] = []
+
+        context = etree.iterparse(
+            xml_path,
+            events=('start', 'end'),
+            tag=_SECTION_TAGS,
+            **self._PARSE_OPTIONS
+        )
+
+        for event, elem in context:
+            if event == 'start':
+                # Reserve the slot now so nested sections keep document order
+                open_sections.append(len(sections))
+                sections.append(None)
+                continue
+
+            ancestors = list(elem.iterancestors())
+            top = ancestors[-2] if len(ancestors) >= 2 else elem
+            sections[open_sections.pop()] = (
+                top,
+                elem.tag == _SECTION,
+                self._parse_section(elem)
+            )
+
+            # Free the section subtree but keep its text for the parent's full_text
+            text = self._raw_text(elem)
+            elem.clear(keep_tail=True)
+            elem.text = text
+
+        return context.root, sections
+
+    @staticmethod
+    def _find_all(xpaths: Tuple[etree.XPath, etree.XPath], element: etree._Element) -> List[etree._Element]:
+        """Evaluate a compiled XPath pair, falling back to the no-namespace form"""
+        return xpaths[0](element) or xpaths[1](element)
+
+    @staticmethod
+    def _find(xpaths: Tuple[etree.XPath, etree.XPath], element: etree._Element) -> Optional[etree._Element]:
+        """First match of a compiled XPath pair, or None"""
+        matches = HKLegalXMLParser._find_all(xpaths, element)
+        return matches[0] if matches else None
+
+    def _parse_ordinance(self, root: etree._Element, xml_path: str, streamed_sections: List[Tuple]) -> Dict:
         """Parse an ordinance document"""
-        return self._parse_document(root, xml_path, 'ordinance')
+        return self._parse_document(root, xml_path, 'ordinance', streamed_sections)
 
-    def _parse_subsidiary_legislation(self, root: ET.Element, xml_path: str) -> Dict:
+    def _parse_subsidiary_legislation(self, root: etree._Element, xml_path: str, streamed_sections: List[Tuple]) -> Dict:
         """Parse a subsidiary legislation document"""
-        return self._parse_document(root, xml_path, 'subsidiary_legislation')
+        return self._parse_document(root, xml_path, 'subsidiary_legislation', streamed_sections)
 
-    def _parse_law_document(self, root: ET.Element, xml_path: str) -> Dict:
+    def _parse_law_document(self, root: etree._Element, xml_path: str, streamed_sections: List[Tuple]) -> Dict:
         """Parse a lawDoc (instrument) document"""
-        return self._parse_document(root, xml_path, 'instrument')
-
-    def _parse_document(self, root: ET.Element, xml_path: str, doc_category: str) -> Dict:
+        return self._parse_document(root, xml_path, 'instrument', streamed_sections)
+
+    def _parse_document(
+        self,
+        root: etree._Element,
+        xml_path: str,
+        doc_category: str,
+        streamed_sections: List[Tuple]
+    ) -> Dict:
         """
         Common parsing logic for all document types
 
@@ -77,6 +223,7 @@ class HKLegalXMLParser:
             root: XML root element
             xml_path: Path to source file
             doc_category: 'ordinance' or 'subsidiary_legislation'
+            streamed_sections: Sections extracted by _stream_sections
 
         Returns:
             Dict containing document data
@@ -85,14 +232,12 @@ class HKLegalXMLParser:
         meta = self._parse_metadata(root)
 
         # Parse main content
-        main_element = root.find('law:main', self.NAMESPACES)
-        if main_element is None:
-            main_element = root.find('main')  # Try without namespace
+        main_element = self._find(self._XP_MAIN, root)
 
         content = self._parse_main_content(main_element) if main_element is not None else {}
 
         # Parse sections
-        sections = self._parse_sections(main_element) if main_element is not None else []
+        sections = self._parse_sections(main_element, streamed_sections) if main_element is not None else []
 
         return {
             'source_file': xml_path,
@@ -108,84 +253,62 @@ class HKLegalXMLParser:
             'long_title': content.get('long_title'),
             'preamble': content.get('preamble'),
             'full_text': content.get('full_text'),
+            'word_count': _word_count(content.get('full_text')),
             'sections': sections,
             'total_sections': len(sections),
             'metadata': meta
         }
 
-    def _parse_metadata(self, root: ET.Element) -> Dict:
+    def _parse_metadata(self, root: etree._Element) -> Dict:
         """Extract metadata from document"""
-        meta_elem = root.find('law:meta', self.NAMESPACES)
-        if meta_elem is None:
-            meta_elem = root.find('meta')
+        meta_elem = self._find(self._XP_META, root)
 
         if meta_elem is None:
             return {}
 
         metadata = {}
 
-        # Extract standard metadata fields
-        fields = {
-            'doc_name': 'law:docName',
-            'doc_type': 'law:docType',
-            'doc_number': 'law:docNumber',
-            'doc_status': 'law:docStatus'
-        }
-
-        for key, tag in fields.items():
-            elem = meta_elem.find(tag, self.NAMESPACES)
-            if elem is None:
-                elem = meta_elem.find(tag.split(':')[-1])
+        # Extract standard and Dublin Core metadata fields
+        for key, xpaths in self._XP_META_FIELDS.items():
+            elem = self._find(xpaths, meta_elem)
             if elem is not None and elem.text:
-                metadata[key] = elem.text.strip()
-
-        # Extract Dublin Core metadata
-        dc_fields = {
-            'identifier': 'dc:identifier',
-            'date': 'dc:date',
-            'title': 'dc:title',
-            'language': 'dc:language',
-            'publisher': 'dc:publisher'
-        }
-
-        for key, tag in dc_fields.items():
-            elem = meta_elem.find(tag, self.NAMESPACES)
-            if elem is None:
-                elem = meta_elem.find(tag.split(':')[-1])
-            if elem is not None and elem.text:
-                metadata[key] = elem.text.strip()
+                value = elem.text.strip()
+                metadata[key] = _intern(value) if key in _INTERNED_META_FIELDS else value
 
         # Parse date
         if 'date' in metadata:
-            try:
-                metadata['effective_date'] = datetime.fromisoformat(metadata['date'])
-            except ValueError:
+            effective_date = None
+
+            # Only attempt ISO dates; anything else skips the exception path
+            if _ISO_DATE_RE.match(metadata['date']):
+                try:
+                    effective_date = datetime.fromisoformat(metadata['date'])
+                except ValueError:
+                    pass  # e.g. 2020-13-45
+
+            if effective_date is not None:
+                metadata['effective_date'] = effective_date
+            else:
                 self.logger.warning(f"Could not parse date: {metadata['date']}")
 
         return metadata
 
-    def _parse_main_content(self, main_elem: ET.Element) -> Dict:
+    def _parse_main_content(self, main_elem: etree._Element) -> Dict:
         """Extract main content sections"""
         content = {}
 
         # Document title
-        title_elem = main_elem.find('law:docTitle', self.NAMESPACES)
-        if title_elem is None:
-            title_elem = main_elem.find('docTitle')
+        title_elem = self._find(self._XP_DOC_TITLE, main_elem)
         if title_elem is not None:
             content['title'] = self._extract_text(title_elem)
 
         # Long title
-        long_title_elem = main_elem.find('law:longTitle', self.NAMESPACES)
-        if long_title_elem is None:
-            long_title_elem = main_elem.find('longTitle')
+        long_title_elem = self._find(self._XP_LONG_TITLE, main_elem)
         if long_title_elem is not None:
             content['long_title'] = self._extract_text(long_title_elem)
 
         # Preamble
-        preamble_elem = main_elem.find('law:preamble', self.NAMESPACES)
-        if preamble_elem is None:
-            preamble_elem = main_elem.find('preamble')
+        preamble_elem = self._find(self._XP_PREAMBLE, main_elem)
         if preamble_elem is not None:
             content['preamble'] = self._extract_text(preamble_elem)
 
@@ -194,100 +317,75 @@ class HKLegalXMLParser:
 
         return content
 
-    def _parse_sections(self, main_elem: ET.Element) -> List[Dict]:
+    def _parse_sections(self, main_elem: etree._Element, streamed_sections: List[Tuple]) -> List[ParsedSection]:
         """
-        Extract all sections from document
+        Select the document's sections from those extracted while streaming
 
         Returns:
-            List of section dicts with id, number, heading, content
+            List of ParsedSection with id, number, heading, content
         """
-        sections = []
-
-        # Find all section elements (may be nested)
-        section_elems = main_elem.findall('.//law:section', self.NAMESPACES)
-        if not section_elems:
-            section_elems = main_elem.findall('.//section')
+        # All sections under main (may be nested), preferring namespaced ones
+        in_main = [(namespaced, data) for top, namespaced, data in streamed_sections if top is main_elem]
+        if any(namespaced for namespaced, _ in in_main):
+            in_main = [(namespaced, data) for namespaced, data in in_main if namespaced]
 
-        for section_elem in section_elems:
-            section_data = self._parse_section(section_elem)
-            if section_data:
-                sections.append(section_data)
+        return [data for _, data in in_main if data]
 
-        return sections
-
-    def _parse_section(self, section_elem: ET.Element) -> Optional[Dict]:
+    def _parse_section(self, section_elem: etree._Element) -> Optional[ParsedSection]:
         """Parse a single section element"""
         try:
             section_id = section_elem.get('id', '')
-            section_name = section_elem.get('name', '')
+            section_name = _intern(section_elem.get('name', '') or '')
 
             # Extract section number
-            num_elem = section_elem.find('law:num', self.NAMESPACES)
-            if num_elem is None:
-                num_elem = section_elem.find('num')
-            section_num = num_elem.text.strip() if num_elem is not None and num_elem.text else ''
+            num_elem = self._find_child(section_elem, _NUM, 'num')
+            section_num = _intern(num_elem.text.strip()) if num_elem is not None and num_elem.text else ''
 
             # Extract heading
-            heading_elem = section_elem.find('law:heading', self.NAMESPACES)
-            if heading_elem is None:
-                heading_elem = section_elem.find('heading')
+            heading_elem = self._find_child(section_elem, _HEADING, 'heading')
             heading = self._extract_text(heading_elem) if heading_elem is not None else ''
 
             # Extract content (paragraphs, subsections, etc.)
             content = self._extract_text(section_elem)
 
-            # Extract subsections
+            # Extract subsections (inlined - this loop runs for every subsection in the corpus)
             subsections = []
-            subsection_elems = section_elem.findall('law:subsection', self.NAMESPACES)
-            if not subsection_elems:
-                subsection_elems = section_elem.findall('subsection')
+            append = subsections.append
+            find_child = self._find_child
+            subsection_elems = section_elem.findall(_SUBSECTION) or section_elem.findall('subsection')
 
             for subsec_elem in subsection_elems:
-                subsec_data = self._parse_subsection(subsec_elem)
-                if subsec_data:
-                    subsections.append(subsec_data)
-
-            return {
-                'section_id': section_id,
-                'section_name': section_name,
-                'section_number': section_num,
-                'heading': heading,
-                'content': content,
-                'subsections': subsections,
-                'has_subsections': len(subsections) > 0
-            }
+                try:
+                    num_elem = find_child(subsec_elem, _NUM, 'num')
+                    append(ParsedSubsection(
+                        subsec_elem.get('id', ''),
+                        _intern(subsec_elem.get('name', '') or ''),
+                        _intern(num_elem.text.strip()) if num_elem is not None and num_elem.text else '',
+                        _WS_RE.sub(' ', ' '.join(subsec_elem.itertext())).strip()
+                    ))
+                except Exception as e:
+                    self.logger.error(f"Failed to parse subsection: {e}")
+
+            return ParsedSection(
+                section_id,
+                section_name,
+                section_num,
+                heading,
+                content,
+                _word_count(content),
+                tuple(subsections)
+            )
 
         except Exception as e:
             self.logger.error(f"Failed to parse section: {e}")
             return None
 
-    def _parse_subsection(self, subsec_elem: ET.Element) -> Optional[Dict]:
-        """Parse a subsection element"""
-        try:
-            subsec_id = subsec_elem.get('id', '')
-            subsec_name = subsec_elem.get('name', '')
+    def _raw_text(self, element: etree._Element) -> str:
+        """Concatenate all text in an element's subtree (whitespace not normalized)"""
+        # Space-joined so adjacent elements (e.g. num + text) don't run together
+        return ' '.join(element.itertext())
 
-            # Extract subsection number
-            num_elem = subsec_elem.find('law:num', self.NAMESPACES)
-            if num_elem is None:
-                num_elem = subsec_elem.find('num')
-            subsec_num = num_elem.text.strip() if num_elem is not None and num_elem.text else ''
-
-            # Extract content
-            content = self._extract_text(subsec_elem)
-
-            return {
-                'subsection_id': subsec_id,
-                'subsection_name': subsec_name,
-                'subsection_number': subsec_num,
-                'content': content
-            }
-
-        except Exception as e:
-            self.logger.error(f"Failed to parse subsection: {e}")
-            return None
-
-    def _extract_text(self, element: Optional[ET.Element]) -> str:
+    def _extract_text(self, element: Optional[etree._Element]) -> str:
         """
         Extract all text content from an element and its children
 
@@ -296,29 +394,27 @@ class HKLegalXMLParser:
         if element is None:
             return ''
 
-        # Get all text including children
-        text_parts = []
-
-        # Element text
-        if element.text:
-            text_parts.append(element.text)
+        # One linear walk over the subtree and one whitespace pass
+        return _WS_RE.sub(' ', self._raw_text(element)).strip()
 
-        # Children text
-        for child in element:
-            child_text = self._extract_text(child)
-            if child_text:
-                text_parts.append(child_text)
+    @staticmethod
+    def _share_strings(doc_data: Dict, cache: Dict[str, str]) -> Dict:
+        """Replace repeated values with one shared instance from cache"""
+        share = cache.setdefault
 
-            # Tail text after child
-            if child.tail:
-                text_parts.append(child.tail)
+        for key in ('doc_type', 'doc_status', 'language'):
+            if doc_data.get(key):
+                doc_data[key] = share(doc_data[key], doc_data[key])
 
-        # Join and clean up
-        text = ' '.join(text_parts)
-        text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
-        text = text.strip()
+        for section in doc_data['sections']:
+            section.section_name = share(section.section_name, section.section_name)
+            section.section_number = share(section.section_number, section.section_number)
+            section.heading = share(section.heading, section.heading)
+            for subsection in section.subsections:
+                subsection.subsection_name = share(subsection.subsection_name, subsection.subsection_name)
+                subsection.subsection_number = share(subsection.subsection_number, subsection.subsection_number)
 
-        return text
+        return doc_data
 
     def extract_references(self, text: str) -> List[str]:
         """
@@ -326,39 +422,74 @@ class HKLegalXMLParser:
 
         Finds patterns like "Cap. 123", "s. 45", "reg. 10"
         """
-        references = []
+        return _CAP_RE.findall(text)
 
-        # Pattern for Cap references: Cap. 123, Cap 123
-        cap_pattern = r'Cap\.?\s*(\d+[A-Z]?)'
-        references.extend(re.findall(cap_pattern, text, re.IGNORECASE))
+    def extract_references_batch(self, texts: List[str]) -> List[List[str]]:
+        """
+        Extract legal references from many texts in a single regex scan
+
+        Args:
+            texts: Texts to scan
+
+        Returns:
+            List of reference lists, one per input text
+        """
+        # Start offset of each text within the joined string
+        offsets = []
+        pos = 0
+        for text in texts:
+            offsets.append(pos)
+            pos += len(text) + 1
+
+        references: List[List[str]] = [[] for _ in texts]
+        for match in _CAP_RE.finditer(_BATCH_SEP.join(texts)):
+            references[bisect_right(offsets, match.start()) - 1].append(match.group(1))
 
         return references
 
-    def batch_parse_directory(self, directory: str) -> List[Dict]:
+    def batch_parse_directory(self, directory: str, max_workers: Optional[int] = None) -> List[Dict]:
         """
         Parse all XML files in a directory
 
+        Files are parsed in a process pool; each worker process uses its own
+        parser instance (parser instances are not shared across processes).
+
         Args:
             directory: Path to directory containing XML files
+            max_workers: Worker processes (defaults to os.cpu_count())
 
         Returns:
             List of parsed document dicts
         """
-        import os
-        from pathlib import Path
-
         documents = []
-        xml_files = list(Path(directory).rglob('*.xml'))
+        # Results are unpickled per document; share repeated strings across documents
+        text_cache: Dict[str, str] = {}
+        xml_files = [str(path) for path in Path(directory).rglob('*.xml')]
 
         self.logger.info(f"Found {len(xml_files)} XML files in {directory}")
 
-        for i, xml_file in enumerate(xml_files, 1):
-            if i % 100 == 0:
-                self.logger.info(f"Parsed {i}/{len(xml_files)} files...")
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            # map() yields in input order; chunksize amortizes IPC per file
+            results = executor.map(_parse_one, xml_files, chunksize=16)
 
-            doc_data = self.parse_file(str(xml_file))
-            if doc_data:
-                documents.append(doc_data)
+            for i, doc_data in enumerate(results, 1):
+                if i % 100 == 0:
+                    self.logger.info(f"Parsed {i}/{len(xml_files)} files...")
+
+                if doc_data:
+                    documents.append(self._share_strings(doc_data, text_cache))
 
         self.logger.info(f"Successfully parsed {len(documents)} documents")
         return documents
+
+
+# Per-process parser used by batch_parse_directory workers
+_worker_parser: Optional[HKLegalXMLParser] = None
+
+
+def _parse_one(xml_path: str) -> Optional[Dict]:
+    """Parse one file in a worker process (module-level so it can be pickled)"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = HKLegalXMLParser()
+    return _worker_parser.parse_file(xml_path)
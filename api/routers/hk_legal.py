@@ -4,12 +4,13 @@ Provides access to HK legislation and instruments
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, undefer
 from typing import List, Optional
 import logging
 
 from database import get_db
-from models.hk_legal_document import HKLegalDocument, HKLegalSection
+from models.hk_legal_document import HKLegalDocument
+from models.hk_legal_section import HKLegalSection
 from services.hk_legal_ingestion import HKLegalIngestionService
 from security.auth import get_current_user
 from models.user import User
@@ -65,7 +66,8 @@ async def list_documents(
     List Hong Kong legal documents with filtering and pagination
     """
     try:
-        query = db.query(HKLegalDocument)
+        # long_title is deferred but part of to_dict() - load it with the page, not per row
+        query = db.query(HKLegalDocument).options(undefer(HKLegalDocument.long_title))
 
         # Apply filters
         if doc_type:
@@ -157,8 +159,10 @@ async def get_document_sections(
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    # Get sections
-    sections = db.query(HKLegalSection).filter(
+    # Get sections (subsection payloads in one IN query, not one per section)
+    sections = db.query(HKLegalSection).options(
+        selectinload(HKLegalSection.subsection_payload)
+    ).filter(
         HKLegalSection.document_id == doc_id
     ).all()
 
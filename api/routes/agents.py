@@ -3,10 +3,15 @@ Agent API Routes
 REST endpoints for agent execution and workflow orchestration
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Dict, Any, List, Optional
+import asyncio
+import httpx
 import logging
+import orjson
+import threading
 
 from agents import (
     LegalResearchAgent,
@@ -15,19 +20,20 @@ from agents import (
     AnalysisAgent,
     SynthesisAgent,
     ValidationAgent,
-    WorkflowOrchestrator
+    WorkflowOrchestrator,
+    agent_concurrency,
+    run_agent
 )
 from agents.synthesis_agent_enhanced import EnhancedSynthesisAgent
 from services.ollama_service import OllamaService
 from services.rag_service import RAGService
-from database import get_db
+from database import SessionLocal
 from qdrant_client import QdrantClient
-from sqlalchemy.orm import Session
-import os
+from sqlalchemy.exc import SQLAlchemyError
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/agents", tags=["agents"])
+router = APIRouter(prefix="/api/agents", tags=["agents"], default_response_class=ORJSONResponse)
 
 
 # ============================================================================
@@ -84,22 +90,74 @@ class WorkflowInfo(BaseModel):
 _agent_registry = {}
 _orchestrator = None
 
+# Only one request builds the registry; concurrent first requests wait for it
+_init_lock = asyncio.Lock()
 
-def get_agent_registry():
-    """Get or initialize agent registry"""
+# Guards the on-demand construction of DB/RAG-backed agents in get_agent
+_agent_init_lock = threading.Lock()
+
+# GET /api/agents/ response; rebuilt after an agent is lazily initialized
+_agents_info: Optional[List[AgentInfo]] = None
+
+
+# The application's Ollama service and Qdrant client (set by configure_services)
+_ollama: Optional[OllamaService] = None
+_qdrant: Optional[QdrantClient] = None
+
+
+def configure_services(ollama: OllamaService, qdrant: QdrantClient):
+    """
+    Give the agents the application's Ollama service and Qdrant client
+
+    The lifespan calls this before building the registry, so agents share
+    the API's connection pools and its embedding concurrency limit.
+    """
+    global _ollama, _qdrant
+    _ollama = ollama
+    _qdrant = qdrant
+
+
+def _get_ollama() -> OllamaService:
+    """Ollama service shared by all agents"""
+    if _ollama is None:
+        raise RuntimeError("Agent services not configured; call configure_services() first")
+    return _ollama
+
+
+def _get_qdrant() -> QdrantClient:
+    """Qdrant client shared by the RAG-backed agents"""
+    if _qdrant is None:
+        raise RuntimeError("Agent services not configured; call configure_services() first")
+    return _qdrant
+
+
+async def get_agent_registry():
+    """
+    Get or initialize agent registry
+
+    The application lifespan calls this at startup (after
+    configure_services), so requests normally take the fast path.
+    """
     global _agent_registry, _orchestrator
 
-    if not _agent_registry:
+    if _agent_registry:
+        return _agent_registry, _orchestrator
+
+    async with _init_lock:
+        # Another request may have finished initialization while we waited
+        if _agent_registry:
+            return _agent_registry, _orchestrator
+
         # Initialize services
-        ollama = OllamaService()
+        ollama = _get_ollama()
 
         # Initialize agents
-        _agent_registry = {
+        registry = {
             "legal_research": {
-                "agent": None,  # Initialized on demand (needs DB)
+                "agent": None,  # Initialized on demand by get_agent (needs DB)
                 "class": LegalResearchAgent,
                 "domain": "legal",
-                "requires_db": True
+                "factory": LegalResearchAgent
             },
             "hr_policy": {
                 "agent": HRPolicyAgent(ollama),
@@ -117,10 +175,10 @@ def get_agent_registry():
                 "domain": "general"
             },
             "synthesis": {
-                "agent": None,  # Initialized on demand (needs RAG for enhanced mode)
+                "agent": None,  # Initialized on demand by get_agent (needs RAG for enhanced mode)
                 "class": EnhancedSynthesisAgent,
                 "domain": "general",
-                "requires_rag": True
+                "factory": EnhancedSynthesisAgent
             },
             "validation": {
                 "agent": ValidationAgent(ollama),
@@ -130,66 +188,45 @@ def get_agent_registry():
         }
 
         # Initialize orchestrator
-        _orchestrator = WorkflowOrchestrator()
-        for agent_name, agent_info in _agent_registry.items():
-            if agent_info["agent"]:
-                _orchestrator.register_agent(agent_info["agent"])
+        orchestrator = WorkflowOrchestrator()
+        orchestrator.register_agents(
+            agent_info["agent"] for agent_info in registry.values() if agent_info["agent"]
+        )
+
+        # Publish only once fully built (the unlocked fast path reads _agent_registry)
+        _orchestrator = orchestrator
+        _agent_registry = registry
 
         logger.info("Agent registry initialized")
 
     return _agent_registry, _orchestrator
 
 
-def get_agent(agent_name: str, db: Session = None):
+async def get_agent(agent_name: str):
     """Get agent instance by name"""
-    registry, _ = get_agent_registry()
+    global _agents_info
+    registry, _ = await get_agent_registry()
 
     if agent_name not in registry:
         raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found")
 
     agent_info = registry[agent_name]
 
-    # Special handling for legal research agent (needs DB)
-    if agent_name == "legal_research":
-        if not agent_info["agent"] and db:
-            ollama = OllamaService()
-            qdrant_host = os.getenv("QDRANT_HOST", "localhost")
-            qdrant_port = int(os.getenv("QDRANT_PORT", "6333"))
-            qdrant = QdrantClient(host=qdrant_host, port=qdrant_port)
-            rag = RAGService(db, qdrant, ollama)
-            agent_info["agent"] = LegalResearchAgent(ollama, rag)
-
-            # Register with orchestrator
-            _, orchestrator = get_agent_registry()
-            orchestrator.register_agent(agent_info["agent"])
-
-        if not agent_info["agent"]:
-            raise HTTPException(
-                status_code=503,
-                detail="Legal research agent requires database connection"
-            )
-
-    # Special handling for synthesis agent (needs RAG for enhanced features)
-    if agent_name == "synthesis":
-        if not agent_info["agent"] and db:
-            ollama = OllamaService()
-            qdrant_host = os.getenv("QDRANT_HOST", "localhost")
-            qdrant_port = int(os.getenv("QDRANT_PORT", "6333"))
-            qdrant = QdrantClient(host=qdrant_host, port=qdrant_port)
-            rag = RAGService(db, qdrant, ollama)
-            agent_info["agent"] = EnhancedSynthesisAgent(ollama, rag)
-
-            # Register with orchestrator
-            _, orchestrator = get_agent_registry()
-            orchestrator.register_agent(agent_info["agent"])
-
-            logger.info("Enhanced Synthesis Agent initialized with RAG capability")
-
-        if not agent_info["agent"]:
-            raise HTTPException(
-                status_code=503,
-                detail="Synthesis agent requires database connection for enhanced features"
-            )
+    # DB-backed agents are built on first use: factory(ollama, rag) -> agent.
+    # They live for the process, so their RAG service opens its own sessions
+    factory = agent_info.get("factory")
+    if factory and not agent_info["agent"]:
+        with _agent_init_lock:
+            if not agent_info["agent"]:
+                ollama = _get_ollama()
+                agent = factory(ollama, RAGService(SessionLocal, _get_qdrant(), ollama))
+
+                # Register with orchestrator
+                _orchestrator.register_agent(agent)
+                agent_info["agent"] = agent
+                _agents_info = None
+
+                logger.info(f"Agent initialized on demand: {agent_name}")
 
     return agent_info["agent"]
 
@@ -206,7 +243,12 @@ async def list_agents():
     Returns information about all registered agents including their
     capabilities, tools, and domain specialization.
     """
-    registry, _ = get_agent_registry()
+    global _agents_info
+
+    if _agents_info is not None:
+        return _agents_info
+
+    registry, _ = await get_agent_registry()
 
     agents_info = []
     for agent_name, agent_info in registry.items():
@@ -230,14 +272,15 @@ async def list_agents():
                 domain=agent_info["domain"]
             ))
 
+    # Capabilities are static once an agent exists
+    _agents_info = agents_info
     return agents_info
 
 
 @router.post("/{agent_name}/execute", response_model=AgentExecuteResponse)
 async def execute_agent(
     agent_name: str,
-    request: AgentExecuteRequest,
-    db: Session = Depends(get_db)
+    request: AgentExecuteRequest
 ):
     """
     Execute a specific agent
@@ -245,7 +288,6 @@ async def execute_agent(
     Args:
         agent_name: Name of the agent to execute
         request: Task specification for the agent
-        db: Database session
 
     Returns:
         Agent execution results
@@ -259,11 +301,11 @@ async def execute_agent(
             }
         }
     """
-    try:
-        agent = get_agent(agent_name, db)
+    agent = await get_agent(agent_name)
 
+    try:
         logger.info(f"Executing agent: {agent_name}")
-        result = await agent.execute(request.task)
+        result = await run_agent(agent, request.task)
 
         return AgentExecuteResponse(
             agent=agent_name,
@@ -272,13 +314,16 @@ async def execute_agent(
             execution_time=result.get("execution_time", 0)
         )
 
-    except Exception as e:
-        logger.error(f"Agent execution error: {e}", exc_info=True)
+    except httpx.HTTPError as e:
+        logger.error(f"Agent execution error (LLM backend): {e}", exc_info=True)
+        raise HTTPException(status_code=502, detail=str(e))
+    except SQLAlchemyError as e:
+        logger.error(f"Agent execution error (database): {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/{agent_name}/info", response_model=AgentInfo)
-async def get_agent_info(agent_name: str, db: Session = Depends(get_db)):
+async def get_agent_info(agent_name: str):
     """
     Get information about a specific agent
 
@@ -288,24 +333,17 @@ async def get_agent_info(agent_name: str, db: Session = Depends(get_db)):
     Returns:
         Agent capabilities and information
     """
-    try:
-        agent = get_agent(agent_name, db)
-        registry, _ = get_agent_registry()
+    agent = await get_agent(agent_name)
+    registry, _ = await get_agent_registry()
 
-        caps = agent.get_capabilities()
+    caps = agent.get_capabilities()
 
-        return AgentInfo(
-            name=caps["name"],
-            description=caps["description"],
-            tools=caps["tools"],
-            domain=registry[agent_name]["domain"]
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting agent info: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    return AgentInfo(
+        name=caps["name"],
+        description=caps["description"],
+        tools=caps["tools"],
+        domain=registry[agent_name]["domain"]
+    )
 
 
 # ============================================================================
@@ -320,15 +358,14 @@ async def list_workflows():
     Returns:
         List of workflow names
     """
-    _, orchestrator = get_agent_registry()
+    _, orchestrator = await get_agent_registry()
     return orchestrator.list_workflows()
 
 
 @router.post("/workflows/{workflow_name}/execute", response_model=WorkflowExecuteResponse)
 async def execute_workflow(
     workflow_name: str,
-    request: WorkflowExecuteRequest,
-    db: Session = Depends(get_db)
+    request: WorkflowExecuteRequest
 ):
     """
     Execute a workflow
@@ -336,7 +373,6 @@ async def execute_workflow(
     Args:
         workflow_name: Name of the workflow to execute
         request: Input data for the workflow
-        db: Database session
 
     Returns:
         Workflow execution results
@@ -350,14 +386,12 @@ async def execute_workflow(
             }
         }
     """
-    try:
-        # Ensure legal agent is initialized if needed
-        get_agent("legal_research", db)
-
-        _, orchestrator = get_agent_registry()
+    # Ensure legal agent is initialized if needed
+    await get_agent("legal_research")
 
+    try:
         logger.info(f"Executing workflow: {workflow_name}")
-        result = await orchestrator.execute_workflow(workflow_name, request.input_data)
+        result = await _orchestrator.execute_workflow(workflow_name, request.input_data)
 
         return WorkflowExecuteResponse(
             workflow=workflow_name,
@@ -369,9 +403,35 @@ async def execute_workflow(
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        logger.error(f"Workflow execution error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/workflows/{workflow_name}/execute/stream")
+async def execute_workflow_stream(
+    workflow_name: str,
+    request: WorkflowExecuteRequest
+):
+    """
+    Execute a workflow, streaming progress as Server-Sent Events
+
+    Emits one `task` event as each task finishes, then a final `workflow`
+    event with the same payload as the non-streaming endpoint.
+
+    Example:
+        curl -N -X POST http://localhost:8000/api/agents/workflows/hr_onboarding/execute/stream \\
+          -H "Content-Type: application/json" \\
+          -d '{"input_data": {"employee_name": "John Doe"}}'
+    """
+    # Ensure legal agent is initialized if needed
+    await get_agent("legal_research")
+
+    if not _orchestrator.get_workflow_definition(workflow_name):
+        raise HTTPException(status_code=404, detail=f"Workflow '{workflow_name}' not found")
+
+    async def event_stream():
+        async for event in _orchestrator.execute_workflow_stream(workflow_name, request.input_data):
+            yield b"event: " + event["type"].encode() + b"\ndata: " + orjson.dumps(event, default=str) + b"\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
 @router.get("/workflows/{workflow_name}", response_model=WorkflowInfo)
@@ -385,7 +445,7 @@ async def get_workflow_info(workflow_name: str):
     Returns:
         Workflow definition and information
     """
-    _, orchestrator = get_agent_registry()
+    _, orchestrator = await get_agent_registry()
 
     workflow_def = orchestrator.get_workflow_definition(workflow_name)
     if not workflow_def:
@@ -410,8 +470,10 @@ async def get_orchestrator_stats():
     Returns:
         Execution statistics and metrics
     """
-    _, orchestrator = get_agent_registry()
-    return orchestrator.get_statistics()
+    _, orchestrator = await get_agent_registry()
+    stats = orchestrator.get_statistics()
+    stats["agent_concurrency"] = agent_concurrency()
+    return stats
 
 
 # ============================================================================
@@ -427,7 +489,7 @@ async def health_check():
         Health status of all agents and orchestrator
     """
     try:
-        registry, orchestrator = get_agent_registry()
+        registry, orchestrator = await get_agent_registry()
 
         agent_status = {}
         for agent_name, agent_info in registry.items():
@@ -4,56 +4,122 @@ Workflow API Routes
 Endpoints for executing and managing multi-agent workflows.
 """
 
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional, List
-from workflows import WorkflowRegistry, get_all_workflows
+from typing import Dict, Any, Optional, List, Tuple
+import asyncio
+from types import MappingProxyType
+from workflows import Workflow, WorkflowRegistry, get_all_workflows
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from database import get_db
 from services.workflow_service import WorkflowService
 
-router = APIRouter(prefix="/api/workflows", tags=["workflows"])
+router = APIRouter(prefix="/api/workflows", tags=["workflows"], default_response_class=ORJSONResponse)
 
 # Global workflow registry
 workflow_registry = WorkflowRegistry()
 
+# Set once the DB-backed agents exist (they stay in the agent registry for good)
+_db_agents_initialized = False
 
-def load_all_workflows():
+# State of the last load_all_workflows() run
+_system_workflows_loaded = False
+_custom_fingerprint = None  # WorkflowService.custom_workflows_fingerprint() at last load
+_custom_workflow_ids = set()
+
+# Workflow builder read responses. Entries are dropped by the CRUD endpoints;
+# the TTL bounds staleness from changes made by other worker processes
+_detail_cache = TTLCache(maxsize=256, ttl=60)  # workflow_id -> detail response
+_list_cache = TTLCache(maxsize=64, ttl=60)  # (category, include_system) -> list response
+
+
+def _invalidate_builder_cache(workflow_id: str):
+    """Forget cached builder responses after a workflow changed"""
+    _detail_cache.pop(workflow_id, None)
+    _list_cache.clear()
+
+
+def _read_custom_workflows(known_fingerprint) -> Optional[Tuple[Any, Dict[str, Workflow]]]:
+    """
+    Read active custom workflows from the database (blocking - run in a thread)
+
+    Returns:
+        (fingerprint, {workflow_id: runtime workflow}), or None if the table
+        is unchanged since known_fingerprint
+    """
+    from database import SessionLocal
+    db = SessionLocal()
+    try:
+        fingerprint = WorkflowService.custom_workflows_fingerprint(db)
+        if fingerprint == known_fingerprint:
+            return None
+
+        custom_workflows = WorkflowService.list_workflows(
+            db=db,
+            is_active=True,
+            include_system=False
+        )
+
+        return fingerprint, {
+            custom_wf.workflow_id: WorkflowService.json_to_workflow(custom_wf)
+            for custom_wf in custom_workflows
+        }
+
+    finally:
+        db.close()
+
+
+async def load_all_workflows() -> bool:
     """
     Load both system workflows and custom database workflows
-    This function is called on module load and can be called to refresh workflows
+    Called from the application lifespan once the database is initialized,
+    and can be called again to refresh workflows
+
+    Custom workflows are only re-read when the table changed since the last
+    load (row count or newest updated_at). Only the database read runs in a
+    worker thread; the registry is updated on the event loop, where requests
+    read it.
+
+    Returns:
+        True if custom workflows were (re)loaded, False if unchanged or unavailable
     """
+    global _system_workflows_loaded, _custom_fingerprint, _custom_workflow_ids
+
     # Load system workflows (hardcoded in workflow_definitions.py)
-    for workflow_id, workflow in get_all_workflows().items():
-        workflow_registry.register(workflow_id, workflow)
+    if not _system_workflows_loaded:
+        for workflow_id, workflow in get_all_workflows().items():
+            workflow_registry.register(workflow_id, workflow)
+        _system_workflows_loaded = True
 
     # Load custom workflows from database
     try:
-        from database import SessionLocal
-        db = SessionLocal()
-        try:
-            custom_workflows = WorkflowService.list_workflows(
-                db=db,
-                is_active=True,
-                include_system=False
-            )
+        loaded = await asyncio.to_thread(_read_custom_workflows, _custom_fingerprint)
+    except (SQLAlchemyError, KeyError, TypeError) as e:
+        # Database not ready yet, or a stored workflow definition is malformed
+        print(f"⚠ Warning: Could not load custom workflows from database: {e}")
+        print("  This is normal on first startup before database tables are created.")
+        return False
 
-            for custom_wf in custom_workflows:
-                runtime_workflow = WorkflowService.json_to_workflow(custom_wf)
-                workflow_registry.register(custom_wf.workflow_id, runtime_workflow)
+    if loaded is None:
+        return False
 
-            print(f"✓ Loaded {len(custom_workflows)} custom workflows from database")
+    fingerprint, custom_workflows = loaded
 
-        finally:
-            db.close()
+    for workflow_id, runtime_workflow in custom_workflows.items():
+        workflow_registry.register(workflow_id, runtime_workflow)
 
-    except Exception as e:
-        print(f"⚠ Warning: Could not load custom workflows from database: {e}")
-        print("  This is normal on first startup before database tables are created.")
+    # Drop workflows deleted or deactivated since the last load
+    for workflow_id in _custom_workflow_ids - custom_workflows.keys():
+        workflow_registry.unregister(workflow_id)
 
+    _custom_workflow_ids = set(custom_workflows)
+    _custom_fingerprint = fingerprint
 
-# Initialize workflows on module load
-load_all_workflows()
+    print(f"✓ Loaded {len(custom_workflows)} custom workflows from database")
+    return True
 
 
 class WorkflowExecuteRequest(BaseModel):
@@ -70,6 +136,11 @@ class WorkflowStepDefinition(BaseModel):
         default_factory=dict,
         description="Task configuration with input_mappings and static_fields"
     )
+    depends_on: Optional[List[str]] = Field(
+        None,
+        description="Earlier steps this step needs; steps with all dependencies met run in parallel "
+                    "(omit to run after every earlier step)"
+    )
 
 
 class WorkflowCreateRequest(BaseModel):
@@ -103,6 +174,16 @@ async def list_workflows():
     }
 
 
+@router.post("/refresh")
+async def refresh_workflows():
+    """Reload custom workflows from the database (no-op if nothing changed)"""
+    reloaded = await load_all_workflows()
+    return {
+        "reloaded": reloaded,
+        "total": len(workflow_registry.workflows)
+    }
+
+
 @router.get("/{workflow_id}")
 async def get_workflow(workflow_id: str):
     """Get details about a specific workflow"""
@@ -117,7 +198,10 @@ async def get_workflow(workflow_id: str):
 
 
 @router.post("/{workflow_id}/execute")
-async def execute_workflow(workflow_id: str, request: WorkflowExecuteRequest):
+async def execute_workflow(
+    workflow_id: str,
+    request: WorkflowExecuteRequest
+):
     """
     Execute a workflow
 
@@ -125,19 +209,19 @@ async def execute_workflow(workflow_id: str, request: WorkflowExecuteRequest):
     The workflow orchestrates multiple agents in sequence and returns
     aggregated results with progress tracking.
     """
+    global _db_agents_initialized
+
     # Get agents registry (avoid circular imports by importing inside function)
     from routes.agents import get_agent_registry, get_agent
-    from database import get_db
-
-    # Get database session
-    db = next(get_db())
 
     # Initialize agents that need database (legal_research, synthesis)
-    get_agent("legal_research", db)
-    get_agent("synthesis", db)
+    if not _db_agents_initialized:
+        await get_agent("legal_research")
+        await get_agent("synthesis")
+        _db_agents_initialized = True
 
     # Get the fully initialized registry
-    agents_registry, _ = get_agent_registry()
+    agents_registry, _ = await get_agent_registry()
 
     try:
         result = await workflow_registry.execute_workflow(
@@ -149,111 +233,111 @@ async def execute_workflow(workflow_id: str, request: WorkflowExecuteRequest):
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Workflow execution failed: {str(e)}")
 
 
-@router.get("/{workflow_id}/schema")
-async def get_workflow_schema(workflow_id: str):
-    """Get input schema for a workflow (describes expected input fields)"""
-    schemas = {
-        "hr_onboarding": {
-            "employee_question": {
-                "type": "string",
-                "required": False,
-                "description": "Specific question about onboarding (optional, defaults to general onboarding)",
-                "example": "What are the key onboarding steps for a new employee?"
-            },
-            "employee_name": {
-                "type": "string",
-                "required": False,
-                "description": "Name of the employee being onboarded",
-                "example": "John Doe"
-            },
-            "role": {
-                "type": "string",
-                "required": False,
-                "description": "Role/position of the new employee",
-                "example": "Software Engineer"
-            },
-            "hr_policies": {
-                "type": "string",
-                "required": False,
-                "description": "HR policy documents (optional, for context)",
-                "example": "Employee Handbook content..."
-            }
+# Input schemas of the system workflows (read-only, shared by every request)
+_WORKFLOW_SCHEMAS = MappingProxyType({
+    "hr_onboarding": {
+        "employee_question": {
+            "type": "string",
+            "required": False,
+            "description": "Specific question about onboarding (optional, defaults to general onboarding)",
+            "example": "What are the key onboarding steps for a new employee?"
+        },
+        "employee_name": {
+            "type": "string",
+            "required": False,
+            "description": "Name of the employee being onboarded",
+            "example": "John Doe"
+        },
+        "role": {
+            "type": "string",
+            "required": False,
+            "description": "Role/position of the new employee",
+            "example": "Software Engineer"
+        },
+        "hr_policies": {
+            "type": "string",
+            "required": False,
+            "description": "HR policy documents (optional, for context)",
+            "example": "Employee Handbook content..."
+        }
+    },
+    "cs_ticket": {
+        "customer_query": {
+            "type": "string",
+            "required": True,
+            "description": "The customer's support question or issue",
+            "example": "How do I reset my password?"
         },
-        "cs_ticket": {
-            "customer_query": {
-                "type": "string",
-                "required": True,
-                "description": "The customer's support question or issue",
-                "example": "How do I reset my password?"
-            },
-            "customer_name": {
-                "type": "string",
-                "required": False,
-                "description": "Customer's name",
-                "example": "Jane Smith"
-            },
-            "support_docs": {
-                "type": "string",
-                "required": False,
-                "description": "Support documentation or FAQs",
-                "example": "Password Reset Guide: Step 1..."
-            }
+        "customer_name": {
+            "type": "string",
+            "required": False,
+            "description": "Customer's name",
+            "example": "Jane Smith"
         },
-        "legal_hr_compliance": {
-            "compliance_area": {
-                "type": "string",
-                "required": True,
-                "description": "Area of compliance to check",
-                "example": "What are the legal requirements for employee leave policies in Hong Kong?"
-            },
-            "policy_name": {
-                "type": "string",
-                "required": True,
-                "description": "Name of the HR policy being validated",
-                "example": "Annual Leave Policy"
-            },
-            "policy_content": {
-                "type": "string",
-                "required": True,
-                "description": "Full text of the HR policy to validate",
-                "example": "Employees receive 7 days annual leave after 12 months..."
-            }
+        "support_docs": {
+            "type": "string",
+            "required": False,
+            "description": "Support documentation or FAQs",
+            "example": "Password Reset Guide: Step 1..."
+        }
+    },
+    "legal_hr_compliance": {
+        "compliance_area": {
+            "type": "string",
+            "required": True,
+            "description": "Area of compliance to check",
+            "example": "What are the legal requirements for employee leave policies in Hong Kong?"
         },
-        "simple_qa": {
-            "question": {
-                "type": "string",
-                "required": True,
-                "description": "Legal question to answer and validate",
-                "example": "What are director duties under Companies Ordinance?"
-            }
+        "policy_name": {
+            "type": "string",
+            "required": True,
+            "description": "Name of the HR policy being validated",
+            "example": "Annual Leave Policy"
         },
-        "multi_agent_research": {
-            "research_topic": {
-                "type": "string",
-                "required": True,
-                "description": "Topic to research from multiple perspectives",
-                "example": "Remote work policies and their legal implications"
-            },
-            "hr_context": {
-                "type": "string",
-                "required": False,
-                "description": "HR-specific context (optional)",
-                "example": "Current remote work policy..."
-            },
-            "cs_context": {
-                "type": "string",
-                "required": False,
-                "description": "Customer service context (optional)",
-                "example": "Customer feedback on remote support..."
-            }
+        "policy_content": {
+            "type": "string",
+            "required": True,
+            "description": "Full text of the HR policy to validate",
+            "example": "Employees receive 7 days annual leave after 12 months..."
+        }
+    },
+    "simple_qa": {
+        "question": {
+            "type": "string",
+            "required": True,
+            "description": "Legal question to answer and validate",
+            "example": "What are director duties under Companies Ordinance?"
+        }
+    },
+    "multi_agent_research": {
+        "research_topic": {
+            "type": "string",
+            "required": True,
+            "description": "Topic to research from multiple perspectives",
+            "example": "Remote work policies and their legal implications"
+        },
+        "hr_context": {
+            "type": "string",
+            "required": False,
+            "description": "HR-specific context (optional)",
+            "example": "Current remote work policy..."
+        },
+        "cs_context": {
+            "type": "string",
+            "required": False,
+            "description": "Customer service context (optional)",
+            "example": "Customer feedback on remote support..."
         }
     }
+})
+
 
-    schema = schemas.get(workflow_id)
+@router.get("/{workflow_id}/schema")
+async def get_workflow_schema(workflow_id: str):
+    """Get input schema for a workflow (describes expected input fields)"""
+    schema = _WORKFLOW_SCHEMAS.get(workflow_id)
     if not schema:
         raise HTTPException(status_code=404, detail=f"Schema for workflow '{workflow_id}' not found")
 
@@ -280,7 +364,7 @@ async def create_custom_workflow(
     """
     try:
         # Convert Pydantic models to dict
-        steps_dict = [step.dict() for step in request.steps]
+        steps_dict = [step.model_dump() for step in request.steps]
 
         # Create workflow in database
         workflow = WorkflowService.create_workflow(
@@ -297,6 +381,7 @@ async def create_custom_workflow(
         # Convert to runtime Workflow and register
         runtime_workflow = WorkflowService.json_to_workflow(workflow)
         workflow_registry.register(request.workflow_id, runtime_workflow)
+        _invalidate_builder_cache(request.workflow_id)
 
         return {
             "success": True,
@@ -306,7 +391,7 @@ async def create_custom_workflow(
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
+    except SQLAlchemyError as e:
         raise HTTPException(status_code=500, detail=f"Failed to create workflow: {str(e)}")
 
 
@@ -325,7 +410,7 @@ async def update_custom_workflow(
         # Convert step models to dict if provided
         steps_dict = None
         if request.steps:
-            steps_dict = [step.dict() for step in request.steps]
+            steps_dict = [step.model_dump() for step in request.steps]
 
         # Update workflow in database
         workflow = WorkflowService.update_workflow(
@@ -346,8 +431,9 @@ async def update_custom_workflow(
             workflow_registry.register(workflow_id, runtime_workflow)
         else:
             # Remove from registry if deactivated
-            if workflow_id in workflow_registry.workflows:
-                del workflow_registry.workflows[workflow_id]
+            workflow_registry.unregister(workflow_id)
+
+        _invalidate_builder_cache(workflow_id)
 
         return {
             "success": True,
@@ -357,7 +443,7 @@ async def update_custom_workflow(
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
+    except SQLAlchemyError as e:
         raise HTTPException(status_code=500, detail=f"Failed to update workflow: {str(e)}")
 
 
@@ -376,8 +462,8 @@ async def delete_custom_workflow(
         WorkflowService.delete_workflow(db, workflow_id)
 
         # Remove from registry
-        if workflow_id in workflow_registry.workflows:
-            del workflow_registry.workflows[workflow_id]
+        workflow_registry.unregister(workflow_id)
+        _invalidate_builder_cache(workflow_id)
 
         return {
             "success": True,
@@ -386,7 +472,7 @@ async def delete_custom_workflow(
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
+    except SQLAlchemyError as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete workflow: {str(e)}")
 
 
@@ -403,20 +489,27 @@ async def list_custom_workflows(
     - category: Filter by category (legal, hr, cs, general)
     - include_system: Include pre-built system workflows (default: true)
     """
+    cache_key = (category, include_system)
+    cached = _list_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        workflows = WorkflowService.list_workflows(
+        workflows = WorkflowService.list_workflow_summaries(
             db=db,
             category=category,
             is_active=True,
             include_system=include_system
         )
 
-        return {
-            "workflows": [w.to_workflow_summary() for w in workflows],
+        response = {
+            "workflows": workflows,
             "total": len(workflows)
         }
+        _list_cache[cache_key] = response
+        return response
 
-    except Exception as e:
+    except SQLAlchemyError as e:
         raise HTTPException(status_code=500, detail=f"Failed to list workflows: {str(e)}")
 
 
@@ -431,18 +524,22 @@ async def get_custom_workflow_detail(
     This endpoint returns the full workflow definition including all steps
     and configuration, suitable for editing in the workflow builder UI.
     """
+    cached = _detail_cache.get(workflow_id)
+    if cached is not None:
+        return cached
+
     try:
         workflow = WorkflowService.get_workflow(db, workflow_id)
 
         if not workflow:
             raise HTTPException(status_code=404, detail=f"Workflow '{workflow_id}' not found")
 
-        return {
+        response = {
             "success": True,
             "workflow": workflow.to_dict()
         }
+        _detail_cache[workflow_id] = response
+        return response
 
-    except HTTPException:
-        raise
-    except Exception as e:
+    except SQLAlchemyError as e:
         raise HTTPException(status_code=500, detail=f"Failed to get workflow: {str(e)}")
@@ -4,24 +4,39 @@ Import Hong Kong Legal Ordinances from XML files
 Parses XML files and imports into PostgreSQL + Qdrant vector database
 """
 
+import io
 import os
 import sys
-import xml.etree.ElementTree as ET
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
 import logging
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 import asyncio
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from lxml import etree
+from sqlalchemy import exists, insert, literal, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    CollectionStatus,
+    Distance,
+    OptimizersConfigDiff,
+    PayloadSchemaType,
+    PointStruct,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    VectorParams
+)
 
-from database import get_db, init_db
-from models.hk_legal_document import HKLegalDocument
+from database import SessionLocal, init_db
+from models.hk_legal_document import HKLegalDocument, compress_text
 from models.hk_legal_section import HKLegalSection
+from models.embedding_cache import EmbeddingCache, embedding_key
 from services.ollama_service import OllamaService
 
 logging.basicConfig(
@@ -30,128 +45,320 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compiled XPath plan for the e-Legislation schema (namespace bound once)
+NAMESPACES = {"h": "http://www.xml.gov.hk/schemas/hklm/1.0"}
+_XP_DOC_NAME = etree.XPath("h:docName", namespaces=NAMESPACES)
+_XP_DOC_NUMBER = etree.XPath("h:docNumber", namespaces=NAMESPACES)
+_XP_NUM = etree.XPath("h:num", namespaces=NAMESPACES)
+_XP_HEADING = etree.XPath("h:heading", namespaces=NAMESPACES)
+
+# Points per Qdrant upsert request
+UPSERT_BATCH_SIZE = 256
+
+# Qdrant collections written by the import
+COLLECTIONS = ("hk_legal_documents", "hk_legal_sections")
+
+# Full-precision vectors live on disk; searches run on int8 codes held in RAM
+# (4x smaller) and rescore the top hits against the originals
+VECTORS_CONFIG = VectorParams(size=768, distance=Distance.COSINE, on_disk=True)
+QUANTIZATION_CONFIG = ScalarQuantization(
+    scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+)
+
+# Payload fields filtered on, indexed before any points arrive so the HNSW
+# build that follows the import can add payload-aware links
+PAYLOAD_INDEXES = {
+    "hk_legal_sections": {
+        "doc_id": PayloadSchemaType.INTEGER,
+        "section_number": PayloadSchemaType.KEYWORD,
+    },
+}
+
+# HNSW indexing threshold restored after the bulk load (Qdrant's default)
+INDEXING_THRESHOLD = int(os.getenv("QDRANT_INDEXING_THRESHOLD", "20000"))
+
+# Clark-notation tags streamed by iterparse
+_META = f"{{{NAMESPACES['h']}}}meta"
+_MAIN = f"{{{NAMESPACES['h']}}}main"
+_LONG_TITLE = f"{{{NAMESPACES['h']}}}longTitle"
+_SECTION = f"{{{NAMESPACES['h']}}}section"
+
+
+def _first(xpath: etree.XPath, element) -> Optional[etree._Element]:
+    """First match of a compiled XPath, or None"""
+    matches = xpath(element)
+    return matches[0] if matches else None
+
+
+def _text(element) -> str:
+    """All text within an element (no re-serialization of the subtree)"""
+    return "".join(element.itertext()).strip()
+
+
+def parse_xml_file(xml_path: str) -> Optional[Dict]:
+    """
+    Parse XML file and extract ordinance data
+
+    Module-level (picklable) so main() can run it in worker processes.
+    """
+    try:
+        meta_seen = False
+        doc_name = doc_number = None
+        title = ""
+        sections = []
+        full_text = io.StringIO()  # Text of every body element, appended as it streams
+
+        # Single streaming pass: each element is handled as soon as it ends.
+        # Text is taken per top-level unit - each child of <main> (long title,
+        # sections, parts, ...) and each other child of the root (schedules) -
+        # after which the unit is freed
+        context = etree.iterparse(str(xml_path), events=("end",), huge_tree=True)
+
+        for _, elem in context:
+            parent = elem.getparent()
+            if parent is None:
+                continue  # The root itself; its children are already handled
+
+            if elem.tag == _META:
+                meta_seen = True
+                doc_name_elem = _first(_XP_DOC_NAME, elem)
+                doc_number_elem = _first(_XP_DOC_NUMBER, elem)
+
+                if doc_name_elem is None or doc_number_elem is None:
+                    logger.warning(f"Missing required metadata in {xml_path}")
+                    return None
+
+                doc_name = doc_name_elem.text
+                doc_number = doc_number_elem.text
+                elem.clear()
+                continue
+
+            if parent.tag == _MAIN:
+                unit_text = _text(elem)
+
+                if elem.tag == _LONG_TITLE:
+                    title = unit_text
+
+                # Only top-level sections of the main body are imported as sections
+                elif elem.tag == _SECTION:
+                    section_num = _first(_XP_NUM, elem)
+                    if section_num is not None and unit_text:
+                        heading_elem = _first(_XP_HEADING, elem)
+                        sections.append({
+                            'section_number': section_num.get('value', section_num.text or ''),
+                            'heading': heading_elem.text if heading_elem is not None else "",
+                            'content': unit_text
+                        })
+
+            elif parent.getparent() is None and elem.tag != _MAIN:
+                unit_text = _text(elem)
+
+            else:
+                continue  # Nested element - read with its top-level unit
+
+            full_text.write("\n")
+            full_text.write(unit_text)
+
+            # Free the unit and the already processed siblings before it
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+
+        if not meta_seen:
+            logger.warning(f"No metadata found in {xml_path}")
+            return None
+
+        # Embedding inputs are built here, in the parse worker, rather than on the event loop
+        embedding_texts = [f"{doc_name}: {title[:200]}"]
+        embedding_texts.extend([
+            f"Section {section['section_number']}: {section['heading']} {section['content'][:500]}"
+            for section in sections
+        ])
+
+        return {
+            'doc_name': doc_name,
+            'doc_number': doc_number,
+            'title': title,
+            'sections': sections,
+            # zstd-compressed in the worker: the column's storage format, and a fraction
+            # of the text's size to pickle back to the parent process
+            'full_text_compressed': compress_text(full_text.getvalue().strip()),
+            'embedding_texts': embedding_texts  # Document text, then one per section
+        }
+
+    except Exception as e:
+        logger.error(f"Error parsing {xml_path}: {e}")
+        return None
+
 
 class HKOrdinanceImporter:
     """Importer for Hong Kong legal ordinances from XML"""
 
-    def __init__(self, db: Session, qdrant: QdrantClient, ollama: OllamaService):
-        self.db = db
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        qdrant: AsyncQdrantClient,
+        ollama: OllamaService,
+        parse_executor: Optional[Executor] = None
+    ):
+        # Each import gets its own session so concurrent imports never share one
+        self.session_factory = session_factory
         self.qdrant = qdrant
         self.ollama = ollama
-        self.namespace = "{http://www.xml.gov.hk/schemas/hklm/1.0}"
+        # XML parsing is CPU-bound; a process pool keeps it off the event loop and the GIL
+        self.parse_executor = parse_executor
+        # doc_numbers taken by this run, so two concurrent imports of the same
+        # ordinance cannot both pass the database existence check
+        self._claimed_doc_numbers = set()
+
+    @staticmethod
+    def _create_document(db: Session, data: Dict) -> Optional[int]:
+        """Insert the document row (blocking); returns its ID, or None if it already exists"""
+        # Don't wait for the WAL flush at commit: the WAL writer flushes the
+        # commits of all concurrent imports together instead of one fsync each.
+        # A database server crash can only lose the last few commits, and those
+        # documents are simply imported again on the next run.
+        db.execute(text("SET LOCAL synchronous_commit TO OFF"))
+
+        # Determine category based on doc_name
+        category = "subsidiary_legislation" if "sub. leg." in data['doc_name'] else "ordinance"
+
+        values = {
+            HKLegalDocument.doc_name: data['doc_name'],
+            HKLegalDocument.doc_number: data['doc_number'],
+            HKLegalDocument.category: category,
+            HKLegalDocument.doc_type: "cap",
+            HKLegalDocument.doc_status: "active",
+            HKLegalDocument.language: "en",
+            HKLegalDocument.title: data['title'][:500] if data['title'] else "",  # Limit title length
+            HKLegalDocument.full_text_compressed: data['full_text_compressed']
+        }
+
+        # Existence check and insert in one statement: no row back means the
+        # document was already imported (doc_number has no unique constraint,
+        # so this is INSERT ... SELECT ... WHERE NOT EXISTS, not ON CONFLICT)
+        return db.execute(
+            insert(HKLegalDocument).from_select(
+                list(values),
+                select(*[literal(value, type_=column.type) for column, value in values.items()]).where(
+                    ~exists().where(HKLegalDocument.doc_number == data['doc_number'])
+                )
+            ).returning(HKLegalDocument.id)
+        ).scalar()
+
+    @staticmethod
+    def _create_sections(db: Session, document_id: int, sections: List[Dict]) -> List[int]:
+        """Insert the section rows (blocking); returns their IDs in order"""
+        if not sections:
+            return []
+
+        # One multi-row INSERT ... RETURNING instead of an INSERT per section
+        return db.execute(
+            insert(HKLegalSection).returning(HKLegalSection.id, sort_by_parameter_order=True),
+            [
+                {
+                    'document_id': document_id,
+                    'section_number': section_data['section_number'],
+                    'heading': section_data['heading'][:200] if section_data['heading'] else "",
+                    'content': section_data['content']
+                }
+                for section_data in sections
+            ]
+        ).scalars().all()
+
+    def _load_cached_embeddings(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Look up cached embeddings in one round-trip (blocking)"""
+        with self.session_factory() as db:
+            rows = db.execute(
+                select(EmbeddingCache.hash, EmbeddingCache.vector).where(EmbeddingCache.hash.in_(keys))
+            ).all()
+        return {key: vector for key, vector in rows}
+
+    def _store_embeddings(self, model: str, new_embeddings: Dict[str, List[float]]):
+        """
+        Add embeddings to the cache (blocking)
+
+        Uses its own short transaction so concurrent imports do not hold cache
+        row locks until their ordinance commits; rows go in key order to keep
+        lock acquisition consistent between writers.
+        """
+        with self.session_factory() as db:
+            db.execute(
+                pg_insert(EmbeddingCache).on_conflict_do_nothing(index_elements=[EmbeddingCache.hash]),
+                [
+                    {'hash': key, 'model': model, 'vector': new_embeddings[key]}
+                    for key in sorted(new_embeddings)
+                ]
+            )
+            db.commit()
+
+    async def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts, only sending those missing from the embedding cache to Ollama
+
+        Boilerplate sections recur verbatim across ordinances, so cache hits
+        save a GPU inference each. Repeats within texts are hashed, looked up
+        and embedded once.
+        """
+        model = self.ollama.embedding_model
+        key_of = {text: embedding_key(model, text) for text in texts}  # Unique texts, first-seen order
+
+        cached = await asyncio.to_thread(self._load_cached_embeddings, list(key_of.values()))
+
+        missing = {key: text for text, key in key_of.items() if key not in cached}
+        if missing:
+            vectors = await self.ollama.embed_batch(list(missing.values()))
+            new_embeddings = dict(zip(missing, vectors))
+            await asyncio.to_thread(self._store_embeddings, model, new_embeddings)
+            cached.update(new_embeddings)
+
+        return [cached[key_of[text]] for text in texts]
+
+    async def parse(self, xml_path: Path) -> Optional[Dict]:
+        """Parse an ordinance file on the parse executor (None if it cannot be parsed)"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.parse_executor, parse_xml_file, str(xml_path)
+        )
 
-    def parse_xml_file(self, xml_path: Path) -> Optional[Dict]:
-        """Parse XML file and extract ordinance data"""
-        try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-
-            # Extract metadata
-            meta = root.find(f"{self.namespace}meta")
-            if meta is None:
-                logger.warning(f"No metadata found in {xml_path}")
-                return None
-
-            doc_name_elem = meta.find(f"{self.namespace}docName")
-            doc_number_elem = meta.find(f"{self.namespace}docNumber")
-
-            if doc_name_elem is None or doc_number_elem is None:
-                logger.warning(f"Missing required metadata in {xml_path}")
-                return None
-
-            doc_name = doc_name_elem.text
-            doc_number = doc_number_elem.text
-
-            # Extract title from longTitle
-            main = root.find(f"{self.namespace}main")
-            title = ""
-            if main is not None:
-                long_title = main.find(f"{self.namespace}longTitle")
-                if long_title is not None:
-                    title = ET.tostring(long_title, encoding='unicode', method='text').strip()
-
-            # Extract sections
-            sections = []
-            if main is not None:
-                for section in main.findall(f"{self.namespace}section"):
-                    section_num = section.find(f"{self.namespace}num")
-                    if section_num is not None:
-                        section_number = section_num.get('value', section_num.text or '')
-
-                        # Extract section heading
-                        heading_elem = section.find(f"{self.namespace}heading")
-                        heading = heading_elem.text if heading_elem is not None else ""
-
-                        # Extract section content (all text)
-                        content = ET.tostring(section, encoding='unicode', method='text').strip()
-
-                        if content:  # Only add if there's actual content
-                            sections.append({
-                                'section_number': section_number,
-                                'heading': heading,
-                                'content': content
-                            })
-
-            return {
-                'doc_name': doc_name,
-                'doc_number': doc_number,
-                'title': title,
-                'sections': sections,
-                'full_text': ET.tostring(root, encoding='unicode', method='text').strip()
-            }
+    async def import_ordinance(self, xml_path: Path, batch_embeddings: bool = True) -> bool:
+        """Parse and import a single ordinance"""
+        data = await self.parse(xml_path)
+        if not data:
+            return False
 
-        except Exception as e:
-            logger.error(f"Error parsing {xml_path}: {e}")
-            return None
+        return await self.import_parsed(data, xml_path)
 
-    async def import_ordinance(self, xml_path: Path, batch_embeddings: bool = True) -> bool:
-        """Import a single ordinance"""
+    async def import_parsed(self, data: Dict, xml_path: Path) -> bool:
+        """
+        Import an ordinance already parsed by parse()
+
+        Database work is synchronous (psycopg2), so it runs in a worker thread
+        to keep the event loop free for the other concurrent imports.
+        """
+        db = self.session_factory()
         try:
-            data = self.parse_xml_file(xml_path)
-            if not data:
+            if data['doc_number'] in self._claimed_doc_numbers:
+                logger.info(f"Document {data['doc_name']} already imported in this run, skipping")
                 return False
+            self._claimed_doc_numbers.add(data['doc_number'])
 
-            # Check if document already exists
-            existing = self.db.query(HKLegalDocument).filter(
-                HKLegalDocument.doc_number == data['doc_number']
-            ).first()
-
-            if existing:
+            document_id = await asyncio.to_thread(self._create_document, db, data)
+            if document_id is None:
                 logger.info(f"Document {data['doc_name']} already exists, skipping")
                 return False
 
-            # Determine category based on doc_name
-            category = "subsidiary_legislation" if "sub. leg." in data['doc_name'] else "ordinance"
-
-            # Create document
-            document = HKLegalDocument(
-                doc_name=data['doc_name'],
-                doc_number=data['doc_number'],
-                category=category,
-                doc_type="cap",
-                doc_status="active",
-                language="en",
-                title=data['title'][:500] if data['title'] else "",  # Limit title length
-                full_text=data['full_text']
-            )
-
-            self.db.add(document)
-            self.db.flush()  # Get document ID
-
-            # Generate document embedding
-            logger.info(f"Generating embedding for document {data['doc_name']}")
-            doc_embedding = await self.ollama.embed(
-                f"{data['doc_name']}: {data['title'][:200]}"
-            )
+            # Generate document and section embeddings (cached, in batched requests)
+            logger.info(f"Generating embeddings for document {data['doc_name']}")
+            doc_embedding, *section_embeddings = await self.embed_texts(data['embedding_texts'])
 
             # Store document in Qdrant
-            self.qdrant.upsert(
+            await self.qdrant.upsert(
                 collection_name="hk_legal_documents",
                 points=[PointStruct(
-                    id=document.id,
+                    id=document_id,
                     vector=doc_embedding,
                     payload={
-                        "db_id": document.id,
+                        "db_id": document_id,
                         "doc_number": data['doc_number'],
                         "doc_name": data['doc_name']
                     }
@@ -159,47 +366,120 @@ class HKOrdinanceImporter:
             )
 
             # Import sections
-            section_count = 0
-            for section_data in data['sections']:
-                section = HKLegalSection(
-                    document_id=document.id,
-                    section_number=section_data['section_number'],
-                    heading=section_data['heading'][:200] if section_data['heading'] else "",
-                    content=section_data['content']
+            section_ids = await asyncio.to_thread(self._create_sections, db, document_id, data['sections'])
+            section_points = [
+                PointStruct(
+                    id=section_id,
+                    vector=section_embedding,
+                    payload={
+                        "db_id": section_id,
+                        "section_number": section_data['section_number'],
+                        "doc_id": document_id
+                    }
                 )
+                for section_id, section_data, section_embedding
+                in zip(section_ids, data['sections'], section_embeddings)
+            ]
 
-                self.db.add(section)
-                self.db.flush()  # Get section ID
-
-                # Generate section embedding
-                section_text = f"Section {section_data['section_number']}: {section_data['heading']} {section_data['content'][:500]}"
-                section_embedding = await self.ollama.embed(section_text)
-
-                # Store section in Qdrant
-                self.qdrant.upsert(
+            # Store sections in Qdrant, a batch of points per request
+            for start in range(0, len(section_points), UPSERT_BATCH_SIZE):
+                await self.qdrant.upsert(
                     collection_name="hk_legal_sections",
-                    points=[PointStruct(
-                        id=section.id,
-                        vector=section_embedding,
-                        payload={
-                            "db_id": section.id,
-                            "section_number": section_data['section_number'],
-                            "doc_id": document.id
-                        }
-                    )]
+                    points=section_points[start:start + UPSERT_BATCH_SIZE],
+                    wait=False
                 )
 
-                section_count += 1
-
-            self.db.commit()
-            logger.info(f"✓ Imported {data['doc_name']} with {section_count} sections")
+            await asyncio.to_thread(db.commit)
+            logger.info(f"✓ Imported {data['doc_name']} with {len(section_points)} sections")
             return True
 
         except Exception as e:
-            self.db.rollback()
+            await asyncio.to_thread(db.rollback)
             logger.error(f"Error importing {xml_path}: {e}", exc_info=True)
             return False
 
+        finally:
+            db.close()
+
+
+async def prepare_collections(qdrant: AsyncQdrantClient):
+    """
+    Create missing import collections and pause HNSW indexing on all of them
+
+    With indexing_threshold=0 upserts skip per-point HNSW maintenance; the
+    index is built once by resume_indexing() after the bulk load. Payload
+    indexes are (re)created here, before the load, for the same reason.
+    """
+    existing = {c.name for c in (await qdrant.get_collections()).collections}
+
+    for collection_name in COLLECTIONS:
+        if collection_name not in existing:
+            logger.info(f"Creating {collection_name} collection")
+            await qdrant.create_collection(
+                collection_name=collection_name,
+                vectors_config=VECTORS_CONFIG,
+                quantization_config=QUANTIZATION_CONFIG,
+                optimizers_config=OptimizersConfigDiff(indexing_threshold=0)
+            )
+        else:
+            await qdrant.update_collection(
+                collection_name=collection_name,
+                optimizers_config=OptimizersConfigDiff(indexing_threshold=0)
+            )
+
+        for field_name, field_schema in PAYLOAD_INDEXES.get(collection_name, {}).items():
+            await qdrant.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=field_schema,
+                wait=True
+            )
+
+
+async def resume_indexing(
+    qdrant: AsyncQdrantClient,
+    wait: bool = False,
+    poll_interval: float = 1.0,
+    wait_timeout: float = 1800.0
+):
+    """
+    Re-enable HNSW indexing on the import collections
+
+    Args:
+        qdrant: Qdrant client
+        wait: Poll until every collection reports green (index built)
+        poll_interval: Seconds between status polls
+        wait_timeout: Seconds to wait for green before giving up
+
+    Raises:
+        RuntimeError: A collection went red (optimizer error) or did not
+            turn green within wait_timeout
+    """
+    for collection_name in COLLECTIONS:
+        await qdrant.update_collection(
+            collection_name=collection_name,
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=INDEXING_THRESHOLD)
+        )
+    logger.info(f"Re-enabled Qdrant indexing (threshold {INDEXING_THRESHOLD})")
+
+    if wait:
+        deadline = asyncio.get_running_loop().time() + wait_timeout
+        for collection_name in COLLECTIONS:
+            while True:
+                info = await qdrant.get_collection(collection_name)
+                if info.status == CollectionStatus.GREEN:
+                    break
+                if info.status == CollectionStatus.RED:
+                    raise RuntimeError(
+                        f"Qdrant collection {collection_name} is red: {info.optimizer_status}"
+                    )
+                if asyncio.get_running_loop().time() >= deadline:
+                    raise RuntimeError(
+                        f"Qdrant collection {collection_name} not indexed after {wait_timeout:.0f}s"
+                    )
+                await asyncio.sleep(poll_interval)
+        logger.info("Qdrant indexes built")
+
 
 async def main():
     """Main import function"""
@@ -212,39 +492,24 @@ async def main():
     # Initialize database
     init_db()
 
-    # Get database session
-    db = next(get_db())
-
-    # Initialize Qdrant
-    qdrant = QdrantClient(
+    # Initialize Qdrant (async client, so upserts overlap with other imports)
+    qdrant = AsyncQdrantClient(
         host=os.getenv("QDRANT_HOST", "localhost"),
-        port=int(os.getenv("QDRANT_PORT", "6333"))
+        port=int(os.getenv("QDRANT_PORT", "6333")),
+        grpc_port=int(os.getenv("QDRANT_GRPC_PORT", "6334")),
+        prefer_grpc=True
     )
 
-    # Ensure collections exist
-    try:
-        qdrant.get_collection("hk_legal_documents")
-    except:
-        logger.info("Creating hk_legal_documents collection")
-        qdrant.create_collection(
-            collection_name="hk_legal_documents",
-            vectors_config=VectorParams(size=768, distance=Distance.COSINE)
-        )
-
-    try:
-        qdrant.get_collection("hk_legal_sections")
-    except:
-        logger.info("Creating hk_legal_sections collection")
-        qdrant.create_collection(
-            collection_name="hk_legal_sections",
-            vectors_config=VectorParams(size=768, distance=Distance.COSINE)
-        )
+    # Ensure collections exist, with HNSW indexing paused for the bulk load
+    await prepare_collections(qdrant)
 
-    # Initialize Ollama
+    # Initialize Ollama (one pooled keep-alive client for every embed request)
     ollama = OllamaService()
+    await ollama.startup()
 
-    # Create importer
-    importer = HKOrdinanceImporter(db, qdrant, ollama)
+    # Create importer (XML parsing runs in worker processes)
+    parse_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    importer = HKOrdinanceImporter(SessionLocal, qdrant, ollama, parse_executor)
 
     # Find all XML files
     xml_files = []
@@ -255,25 +520,46 @@ async def main():
 
     logger.info(f"Found {len(xml_files)} XML files to import")
 
-    # Import ordinances
+    # Import ordinances concurrently - each file mostly waits on Ollama and Qdrant
+    concurrency = int(os.getenv("IMPORT_CONCURRENCY", "8"))
+    semaphore = asyncio.Semaphore(concurrency)
+    logger.info(f"Importing with concurrency {concurrency}")
+
+    async def bounded_import(xml_file: Path) -> bool:
+        async with semaphore:
+            logger.info(f"Processing {xml_file.name}")
+            try:
+                return await importer.import_ordinance(xml_file)
+            except Exception as e:
+                logger.error(f"Error importing {xml_file}: {e}", exc_info=True)
+                return False
+
     imported_count = 0
     failed_count = 0
 
-    for i, xml_file in enumerate(xml_files, 1):
-        logger.info(f"Processing {i}/{len(xml_files)}: {xml_file.name}")
-
-        success = await importer.import_ordinance(xml_file)
-        if success:
-            imported_count += 1
-        else:
-            failed_count += 1
-
-        # Log progress every 50 files
-        if i % 50 == 0:
-            logger.info(f"Progress: {i}/{len(xml_files)} - Imported: {imported_count}, Failed: {failed_count}")
+    try:
+        tasks = [asyncio.create_task(bounded_import(xml_file)) for xml_file in xml_files]
+
+        # Count results as they finish so progress stays live during the fan-out
+        for i, task in enumerate(asyncio.as_completed(tasks), 1):
+            if await task:
+                imported_count += 1
+            else:
+                failed_count += 1
+
+            # Log progress every 50 files
+            if i % 50 == 0:
+                logger.info(f"Progress: {i}/{len(xml_files)} - Imported: {imported_count}, Failed: {failed_count}")
+    finally:
+        try:
+            # Qdrant builds the HNSW graphs in the background
+            await resume_indexing(qdrant)
+        finally:
+            parse_executor.shutdown()
+            await ollama.shutdown()
+            await qdrant.close()
 
     logger.info(f"Import complete! Imported: {imported_count}, Failed: {failed_count}")
-    db.close()
 
 
 if __name__ == "__main__":
@@ -12,19 +12,6 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from agents import (
-    BaseAgent,
-    LegalResearchAgent,
-    AnalysisAgent,
-    SynthesisAgent,
-    ValidationAgent,
-    WorkflowOrchestrator
-)
-from services.ollama_service import OllamaService
-from services.rag_service import RAGService
-from db.database import SessionLocal
-from db.qdrant_client import get_qdrant_client
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -35,6 +22,9 @@ logger = logging.getLogger(__name__)
 
 async def test_analysis_agent():
     """Test AnalysisAgent functionality"""
+    from agents import AnalysisAgent
+    from services.ollama_service import OllamaService
+
     print("\n" + "="*70)
     print("TEST: Analysis Agent")
     print("="*70)
@@ -72,6 +62,9 @@ async def test_analysis_agent():
 
 async def test_synthesis_agent():
     """Test SynthesisAgent functionality"""
+    from agents import SynthesisAgent
+    from services.ollama_service import OllamaService
+
     print("\n" + "="*70)
     print("TEST: Synthesis Agent")
     print("="*70)
@@ -110,6 +103,9 @@ async def test_synthesis_agent():
 
 async def test_validation_agent():
     """Test ValidationAgent functionality"""
+    from agents import ValidationAgent
+    from services.ollama_service import OllamaService
+
     print("\n" + "="*70)
     print("TEST: Validation Agent")
     print("="*70)
@@ -145,6 +141,9 @@ async def test_validation_agent():
 
 async def test_orchestrator():
     """Test WorkflowOrchestrator"""
+    from agents import BaseAgent, WorkflowOrchestrator
+    from services.ollama_service import OllamaService
+
     print("\n" + "="*70)
     print("TEST: Workflow Orchestrator")
     print("="*70)
@@ -219,6 +218,9 @@ async def test_orchestrator():
 
 async def test_agent_tools():
     """Test agent tool system"""
+    from agents import BaseAgent
+    from services.ollama_service import OllamaService
+
     print("\n" + "="*70)
     print("TEST: Agent Tool System")
     print("="*70)
@@ -261,6 +263,9 @@ async def test_agent_tools():
 
 async def test_agent_memory():
     """Test agent memory system"""
+    from agents import AnalysisAgent
+    from services.ollama_service import OllamaService
+
     print("\n" + "="*70)
     print("TEST: Agent Memory System")
     print("="*70)
@@ -300,6 +305,9 @@ async def test_agent_memory():
 
 async def test_error_handling():
     """Test error handling in agents and orchestrator"""
+    from agents import AnalysisAgent, WorkflowOrchestrator
+    from services.ollama_service import OllamaService
+
     print("\n" + "="*70)
     print("TEST: Error Handling")
     print("="*70)
@@ -12,11 +12,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from agents import BaseAgent, LegalResearchAgent
-from services.ollama_service import OllamaService
-from services.rag_service import RAGService
-from db.database import SessionLocal
-from db.qdrant_client import get_qdrant_client
+# Imports are per test: importing this module connects to nothing
 
 # Configure logging
 logging.basicConfig(
@@ -28,6 +24,9 @@ logger = logging.getLogger(__name__)
 
 async def test_base_agent():
     """Test base agent functionality"""
+    from agents import BaseAgent
+    from services.ollama_service import OllamaService
+
     print("\n" + "="*70)
     print("TEST 1: Base Agent Functionality")
     print("="*70)
@@ -80,15 +79,20 @@ async def test_base_agent():
 
 async def test_legal_research_agent():
     """Test legal research agent"""
+    from agents import LegalResearchAgent
+    from services.ollama_service import OllamaService
+    from services.rag_service import RAGService
+    from db.database import SessionLocal
+    from db.qdrant_client import get_qdrant_client
+
     print("\n" + "="*70)
     print("TEST 2: Legal Research Agent")
     print("="*70)
 
     # Initialize services
-    db = SessionLocal()
     qdrant = get_qdrant_client()
     ollama = OllamaService()
-    rag = RAGService(db, qdrant, ollama)
+    rag = RAGService(SessionLocal, qdrant, ollama)
 
     # Initialize legal agent
     legal_agent = LegalResearchAgent(ollama, rag)
@@ -140,12 +144,14 @@ async def test_legal_research_agent():
     print(f"   Total queries: {stats['total_queries']}")
     print(f"   Confidence distribution: {stats.get('confidence_distribution', {})}")
 
-    db.close()
     return True
 
 
 async def test_agent_memory():
     """Test agent memory system"""
+    from agents import BaseAgent
+    from services.ollama_service import OllamaService
+
     print("\n" + "="*70)
     print("TEST 3: Agent Memory System")
     print("="*70)
@@ -5,84 +5,108 @@ Test import of HK ordinances with fixed model
 import asyncio
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, '/app')
 
-from database import get_db, init_db
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams
+from database import SessionLocal, init_db
+from qdrant_client import AsyncQdrantClient
 from services.ollama_service import OllamaService
-from scripts.import_hk_ordinances import HKOrdinanceImporter
+from scripts.import_hk_ordinances import HKOrdinanceImporter, prepare_collections, resume_indexing
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parsed files buffered ahead of the importers, and concurrent importers
+QUEUE_SIZE = 4
+IMPORT_WORKERS = 3
+
+
 async def test_import():
     """Test import with first 3 files"""
     init_db()
-    db = next(get_db())
-
-    qdrant = QdrantClient(host='qdrant', port=6333)
 
-    # Create collections
-    try:
-        qdrant.create_collection(
-            collection_name='hk_legal_documents',
-            vectors_config=VectorParams(size=768, distance=Distance.COSINE)
-        )
-        logger.info("Created hk_legal_documents collection")
-    except Exception as e:
-        logger.info(f"Collection exists: {e}")
+    # gRPC: protobuf point batches over one persistent HTTP/2 channel
+    qdrant = AsyncQdrantClient(host='qdrant', port=6333, grpc_port=6334, prefer_grpc=True)
 
-    try:
-        qdrant.create_collection(
-            collection_name='hk_legal_sections',
-            vectors_config=VectorParams(size=768, distance=Distance.COSINE)
-        )
-        logger.info("Created hk_legal_sections collection")
-    except Exception as e:
-        logger.info(f"Collection exists: {e}")
+    # Create collections; HNSW indexing stays off until the import is done
+    await prepare_collections(qdrant)
 
     ollama = OllamaService()
-    importer = HKOrdinanceImporter(db, qdrant, ollama)
+    # XML parsing is pure CPU - run it in worker processes so the event loop
+    # stays free to drive Ollama/Qdrant I/O
+    parse_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    importer = HKOrdinanceImporter(SessionLocal, qdrant, ollama, parse_executor)
 
     # Test with first 3 files
     import_dir = Path('/app/data/hkel_legal_import')
     test_files = []
 
-    cap_dirs = sorted([d for d in import_dir.iterdir() if d.is_dir() and d.name.startswith('cap_')])[:3]
+    # scandir: names and d_type come from the dirent, no stat per entry
+    with os.scandir(import_dir) as entries:
+        cap_dirs = sorted(
+            e.path for e in entries
+            if e.name.startswith('cap_') and e.is_dir(follow_symlinks=False)
+        )[:3]
 
     for cap_dir in cap_dirs:
-        for xml_file in cap_dir.glob('*.xml'):
-            test_files.append(xml_file)
-            break  # Only first XML from each dir
+        with os.scandir(cap_dir) as entries:
+            # Only first XML from each dir
+            xml_path = next((e.path for e in entries if e.name.endswith('.xml')), None)
+        if xml_path is not None:
+            test_files.append(Path(xml_path))
 
     logger.info(f"Testing with {len(test_files)} files")
 
-    success_count = 0
-    failed_count = 0
+    # Pipeline: parse files in parallel while earlier ones wait on Ollama/Qdrant
+    queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    results = []
+
+    async def parse(xml_file):
+        return xml_file, await importer.parse(xml_file)
 
-    for i, xml_file in enumerate(test_files, 1):
-        logger.info(f"\n{'='*70}")
-        logger.info(f"Test {i}/{len(test_files)}: {xml_file.name}")
-        logger.info(f"{'='*70}")
+    async def produce():
+        # Hand files to the importers in the order their parses finish
+        for i, parsed in enumerate(asyncio.as_completed([parse(f) for f in test_files]), 1):
+            xml_file, data = await parsed
+            await queue.put((i, xml_file, data))
+        for _ in range(IMPORT_WORKERS):
+            await queue.put(None)
 
-        success = await importer.import_ordinance(xml_file)
+    async def consume():
+        while (item := await queue.get()) is not None:
+            i, xml_file, data = item
+            logger.info(f"\n{'='*70}")
+            logger.info(f"Test {i}/{len(test_files)}: {xml_file.name}")
+            logger.info(f"{'='*70}")
 
-        if success:
-            success_count += 1
-            logger.info("✓ SUCCESS")
-        else:
-            failed_count += 1
-            logger.error("✗ FAILED")
+            success = data is not None and await importer.import_parsed(data, xml_file)
+            results.append(success)
+
+            if success:
+                logger.info(f"✓ SUCCESS: {xml_file.name}")
+            else:
+                logger.error(f"✗ FAILED: {xml_file.name}")
+
+    try:
+        await asyncio.gather(produce(), *[consume() for _ in range(IMPORT_WORKERS)])
+    finally:
+        # Build the HNSW index once, now that all points are in
+        await resume_indexing(qdrant, wait=True)
+        parse_executor.shutdown()
+
+    success_count = sum(results)
+    failed_count = len(results) - success_count
 
     logger.info(f"\n{'='*70}")
     logger.info(f"Test Results: {success_count} succeeded, {failed_count} failed")
     logger.info(f"{'='*70}")
 
-    db.close()
+    await ollama.shutdown()
+    await qdrant.close()
+
 
 if __name__ == "__main__":
     asyncio.run(test_import())
@@ -4,15 +4,19 @@ Service for ingesting HK legal documents into database and vector store
 
 import logging
 import uuid
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, VectorParams, PointStruct
 
 from parsers.hk_legal_xml_parser import HKLegalXMLParser
-from models.hk_legal_document import HKLegalDocument
+from parsers._types import ParsedSection
+from models.hk_legal_document import HKLegalDocument, compress_text
 from models.hk_legal_section import HKLegalSection
+from models.hk_legal_subsection_payload import HKLegalSubsectionPayload, payload_hash
 from services.ollama_service import OllamaService
 
 logger = logging.getLogger(__name__)
@@ -83,6 +87,89 @@ class HKLegalIngestionService:
             logger.error(f"Failed to initialize Qdrant collections: {e}")
             raise
 
+    @staticmethod
+    def _document_fields(doc_data: Dict) -> Dict:
+        """Map parser output to HKLegalDocument column values"""
+        return {
+            'doc_number': doc_data['doc_number'],
+            'doc_name': doc_data['doc_name'],
+            'identifier': doc_data['identifier'],
+            'category': doc_data['category'],
+            'doc_type': doc_data['doc_type'],
+            'doc_status': doc_data['doc_status'],
+            'effective_date': doc_data['effective_date'],
+            'language': doc_data['language'],
+            'title': doc_data['title'],
+            'long_title': doc_data['long_title'],
+            'preamble': doc_data['preamble'],
+            'full_text_compressed': compress_text(doc_data['full_text']) if doc_data['full_text'] is not None else None,
+            'total_sections': doc_data['total_sections'],
+            'word_count': doc_data['word_count'],
+            'source_file': doc_data['source_file'],
+            'metadata_json': clean_metadata_for_json(doc_data['metadata'])
+        }
+
+    # HKLegalSection columns filled from parser output (document_id is added on insert)
+    SECTION_FIELDS = (
+        'section_id', 'section_name', 'section_number', 'heading',
+        'content', 'word_count', 'has_subsections', 'subsection_payload_id'
+    )
+
+    @staticmethod
+    def _section_values(section_data: ParsedSection, payload_id: Optional[int]) -> Tuple:
+        """Map parsed section data to HKLegalSection column values, in SECTION_FIELDS order"""
+        return (
+            section_data.section_id,
+            section_data.section_name,
+            section_data.section_number,
+            section_data.heading,
+            section_data.content,
+            section_data.word_count,
+            1 if section_data.has_subsections else 0,
+            payload_id
+        )
+
+    @classmethod
+    def _section_fields(cls, section_data: ParsedSection, payload_id: Optional[int]) -> Dict:
+        """Map parsed section data to HKLegalSection column values"""
+        return dict(zip(cls.SECTION_FIELDS, cls._section_values(section_data, payload_id)))
+
+    def _subsection_payload_ids(self, sections: List[ParsedSection], batch_size: int = 5000) -> List[Optional[int]]:
+        """
+        Store each distinct subsections payload once and return its ID per section
+
+        Sections without subsections get None. Payloads already in the table
+        (same content hash) are reused.
+        """
+        keys: List[Optional[str]] = []
+        payloads: Dict[str, List[Dict]] = {}
+        for section in sections:
+            if not section.subsections:
+                keys.append(None)
+                continue
+            payload = section.subsections_json()
+            key = payload_hash(payload)
+            payloads.setdefault(key, payload)
+            keys.append(key)
+
+        if not payloads:
+            return keys
+
+        hashes = list(payloads)
+        ids: Dict[str, int] = {}
+        for start in range(0, len(hashes), batch_size):
+            chunk = hashes[start:start + batch_size]
+            self.db.execute(
+                pg_insert(HKLegalSubsectionPayload).on_conflict_do_nothing(index_elements=['hash']),
+                [{'hash': key, 'payload': payloads[key]} for key in chunk]
+            )
+            ids.update(self.db.execute(
+                select(HKLegalSubsectionPayload.hash, HKLegalSubsectionPayload.id)
+                .where(HKLegalSubsectionPayload.hash.in_(chunk))
+            ).tuples())
+
+        return [ids[key] if key is not None else None for key in keys]
+
     async def ingest_xml_file(self, xml_path: str) -> Optional[HKLegalDocument]:
         """
         Ingest a single XML file
@@ -110,24 +197,7 @@ class HKLegalIngestionService:
                 return existing
 
             # Create document record
-            document = HKLegalDocument(
-                doc_number=doc_data['doc_number'],
-                doc_name=doc_data['doc_name'],
-                identifier=doc_data['identifier'],
-                category=doc_data['category'],
-                doc_type=doc_data['doc_type'],
-                doc_status=doc_data['doc_status'],
-                effective_date=doc_data['effective_date'],
-                language=doc_data['language'],
-                title=doc_data['title'],
-                long_title=doc_data['long_title'],
-                preamble=doc_data['preamble'],
-                full_text=doc_data['full_text'],
-                total_sections=doc_data['total_sections'],
-                word_count=len(doc_data['full_text'].split()) if doc_data['full_text'] else 0,
-                source_file=xml_path,
-                metadata_json=clean_metadata_for_json(doc_data['metadata'])
-            )
+            document = HKLegalDocument(**self._document_fields(doc_data))
 
             # Add to database
             self.db.add(document)
@@ -161,24 +231,19 @@ class HKLegalIngestionService:
                 document.qdrant_id = qdrant_id
 
             # Process sections
-            for section_data in doc_data['sections']:
+            payload_ids = self._subsection_payload_ids(doc_data['sections'])
+            for section_data, payload_id in zip(doc_data['sections'], payload_ids):
                 section = HKLegalSection(
                     document_id=document.id,
-                    section_id=section_data['section_id'],
-                    section_name=section_data['section_name'],
-                    section_number=section_data['section_number'],
-                    heading=section_data['heading'],
-                    content=section_data['content'],
-                    has_subsections=1 if section_data['has_subsections'] else 0,
-                    subsections_json=section_data['subsections']
+                    **self._section_fields(section_data, payload_id)
                 )
 
                 self.db.add(section)
                 self.db.flush()
 
                 # Generate embedding for section
-                if section_data['content']:
-                    section_text = f"{section_data['heading']} {section_data['content']}"
+                if section_data.content:
+                    section_text = f"{section_data.heading} {section_data.content}"
                     section_embedding = await self.ollama.embed(section_text)
 
                     # Store in Qdrant
@@ -269,6 +334,83 @@ class HKLegalIngestionService:
 
         return stats
 
+    def bulk_load(self, documents: List[Dict], batch_size: int = 5000) -> Dict:
+        """
+        Insert parsed documents and their sections without embeddings
+
+        Uses multi-row INSERT ... RETURNING instead of per-object ORM flushes:
+        documents first, then sections keyed by the returned document IDs.
+        Documents whose identifier already exists are skipped. Vectors can be
+        generated afterwards by the embedding pipeline.
+
+        Args:
+            documents: Output of HKLegalXMLParser.batch_parse_directory()
+            batch_size: Rows per INSERT statement
+
+        Returns:
+            Dict with inserted document and section counts
+        """
+        # Skip documents already in the database (and duplicates within the batch)
+        identifiers = [doc['identifier'] for doc in documents if doc.get('identifier')]
+        seen = set()
+        for start in range(0, len(identifiers), batch_size):
+            seen.update(
+                row[0] for row in self.db.execute(
+                    select(HKLegalDocument.identifier).where(
+                        HKLegalDocument.identifier.in_(identifiers[start:start + batch_size])
+                    )
+                )
+            )
+
+        new_documents = []
+        for doc in documents:
+            identifier = doc.get('identifier')
+            if identifier:
+                if identifier in seen:
+                    continue
+                seen.add(identifier)
+            new_documents.append(doc)
+
+        try:
+            total_sections = 0
+
+            for start in range(0, len(new_documents), batch_size):
+                batch = new_documents[start:start + batch_size]
+                document_ids = self.db.execute(
+                    insert(HKLegalDocument).returning(HKLegalDocument.id, sort_by_parameter_order=True),
+                    [self._document_fields(doc) for doc in batch]
+                ).scalars().all()
+
+                # This batch's sections, keyed by the document IDs just returned
+                payload_ids = iter(self._subsection_payload_ids(
+                    [section for doc in batch for section in doc['sections']]
+                ))
+                section_rows = []
+                for document_id, doc in zip(document_ids, batch):
+                    for section in doc['sections']:
+                        row = self._section_fields(section, next(payload_ids))
+                        row['document_id'] = document_id
+                        section_rows.append(row)
+
+                for row_start in range(0, len(section_rows), batch_size):
+                    self.db.execute(insert(HKLegalSection), section_rows[row_start:row_start + batch_size])
+                total_sections += len(section_rows)
+
+            self.db.commit()
+
+        except Exception:
+            self.db.rollback()
+            raise
+
+        logger.info(f"Bulk loaded {len(new_documents)} documents with {total_sections} sections "
+                   f"({len(documents) - len(new_documents)} skipped)")
+
+        return {
+            'documents': len(new_documents),
+            'sections': total_sections,
+            'skipped': len(documents) - len(new_documents)
+        }
+
     def get_document_count(self) -> int:
         """Get total number of documents in database"""
         return self.db.query(HKLegalDocument).count()
@@ -282,6 +424,7 @@ class HKLegalIngestionService:
         return {
             'documents': self.get_document_count(),
             'sections': self.get_section_count(),
+            'words': self.db.query(func.sum(HKLegalDocument.word_count)).scalar() or 0,
             'qdrant_documents': self.qdrant.count(self.COLLECTION_DOCUMENTS).count,
             'qdrant_sections': self.qdrant.count(self.COLLECTION_SECTIONS).count
         }
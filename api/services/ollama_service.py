@@ -3,13 +3,21 @@ Ollama Service - Integration with local Ollama instance
 Uses your existing llama3.3:70b model
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional
-import aiohttp
+from typing import AsyncIterator, Dict, List, Optional
+import httpx
+import json
 import os
 
 logger = logging.getLogger(__name__)
 
+# Per-request timeouts (a per-call timeout replaces the client's default entirely,
+# so each keeps the short connect timeout)
+GENERATE_TIMEOUT = httpx.Timeout(600.0, connect=5.0)  # 10 min for llama3.3:70b
+EMBED_TIMEOUT = httpx.Timeout(120.0, connect=5.0)  # 2 min for embeddings
+METADATA_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
 
 class OllamaService:
     """Service for communicating with Ollama LLM"""
@@ -18,6 +26,37 @@ class OllamaService:
         self.base_url = os.getenv("OLLAMA_URL", "http://ollama:11434")
         self.model = os.getenv("OLLAMA_MODEL", "llama3.3:70b")
         self.embedding_model = os.getenv("OLLAMA_EMBEDDING_MODEL", "nomic-embed-text:latest")
+        self._client: Optional[httpx.AsyncClient] = None
+        # Embedding requests in flight to Ollama (match the server's OLLAMA_NUM_PARALLEL);
+        # excess callers queue here instead of inside Ollama
+        self._embed_semaphore = asyncio.Semaphore(int(os.getenv("OLLAMA_MAX_CONCURRENCY", "8")))
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use
+
+        A single keep-alive client is reused for every request so connection
+        setup is paid once rather than per call.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=GENERATE_TIMEOUT,
+                # Keep idle connections warm across gaps between requests
+                # (e.g. while an importer parses the next file)
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60)
+            )
+        return self._client
+
+    async def startup(self):
+        """Open the shared HTTP client (call from the application lifespan)"""
+        self._get_client()
+
+    async def shutdown(self):
+        """Close the shared HTTP client and release pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def set_model(self, model_name: str) -> bool:
         """
@@ -47,65 +86,109 @@ class OllamaService:
         self.embedding_model = model_name
         return True
 
+    def _build_chat_payload(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> Dict:
+        """Build a streaming /api/chat request payload"""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        return {
+            "model": self.model,
+            "messages": messages,
+            "stream": True,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens
+            }
+        }
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: int = 4096
+    ) -> AsyncIterator[str]:
+        """
+        Generate text using Ollama, yielding NDJSON chunks as they arrive
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Newline-terminated JSON lines from Ollama's /api/chat stream
+        """
+        payload = self._build_chat_payload(prompt, system_prompt, temperature, max_tokens)
+
+        async with self._get_client().stream(
+            "POST",
+            "/api/chat",
+            json=payload,
+            timeout=GENERATE_TIMEOUT
+        ) as response:
+            if response.status_code != 200:
+                error_text = (await response.aread()).decode(errors="replace")
+                logger.error(f"Ollama error: {response.status_code} - {error_text}")
+                raise Exception(f"Ollama request failed: {response.status_code}")
+
+            async for line in response.aiter_lines():
+                if line:
+                    yield line + "\n"
+
     async def generate(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: float = 0.3,
-        max_tokens: int = 4096,
-        stream: bool = False
+        max_tokens: int = 4096
     ) -> Dict:
         """
         Generate text using Ollama
 
+        Consumes generate_stream() and accumulates the full completion.
+
         Args:
             prompt: User prompt
             system_prompt: System instruction
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens to generate
-            stream: Whether to stream the response
 
         Returns:
             Dict with response and metadata
         """
         try:
-            # Build messages
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
+            parts = []
+            final = {}
 
-            # Prepare request
-            payload = {
-                "model": self.model,
-                "messages": messages,
-                "stream": stream,
-                "options": {
-                    "temperature": temperature,
-                    "num_predict": max_tokens
-                }
-            }
+            async for line in self.generate_stream(prompt, system_prompt, temperature, max_tokens):
+                chunk = json.loads(line)
+                # Ollama reports failures mid-stream as an error line in a 200 response
+                if "error" in chunk:
+                    raise Exception(f"Ollama generation failed: {chunk['error']}")
+                parts.append(chunk.get("message", {}).get("content", ""))
+                if chunk.get("done"):
+                    final = chunk
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/chat",
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=600)  # 10 min for llama3.3:70b
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Ollama error: {response.status} - {error_text}")
-                        raise Exception(f"Ollama request failed: {response.status}")
-
-                    result = await response.json()
-
-                    return {
-                        "response": result["message"]["content"],
-                        "model": result.get("model", self.model),
-                        "total_duration": result.get("total_duration", 0),
-                        "prompt_eval_count": result.get("prompt_eval_count", 0),
-                        "eval_count": result.get("eval_count", 0)
-                    }
+            if not final:
+                raise Exception("Ollama stream ended before completion")
+
+            return {
+                "response": "".join(parts),
+                "model": final.get("model", self.model),
+                "total_duration": final.get("total_duration", 0),
+                "prompt_eval_count": final.get("prompt_eval_count", 0),
+                "eval_count": final.get("eval_count", 0)
+            }
 
         except Exception as e:
             logger.error(f"Ollama generation error: {e}", exc_info=True)
@@ -127,24 +210,64 @@ class OllamaService:
                 "prompt": text
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/embeddings",
+            async with self._embed_semaphore:
+                response = await self._get_client().post(
+                    "/api/embeddings",
                     json=payload,
-                    timeout=aiohttp.ClientTimeout(total=120)  # 2 min for embeddings
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Ollama embedding error: {response.status} - {error_text}")
-                        raise Exception(f"Embedding request failed: {response.status}")
+                    timeout=EMBED_TIMEOUT
+                )
+            if response.status_code != 200:
+                logger.error(f"Ollama embedding error: {response.status_code} - {response.text}")
+                raise Exception(f"Embedding request failed: {response.status_code}")
 
-                    result = await response.json()
-                    return result["embedding"]
+            return response.json()["embedding"]
 
         except Exception as e:
             logger.error(f"Ollama embedding error: {e}", exc_info=True)
             raise
 
+    async def embed_batch(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+        """
+        Generate embeddings for several texts in one Ollama call per batch
+
+        Args:
+            texts: Texts to embed
+            batch_size: Maximum texts sent in a single /api/embed request
+
+        Returns:
+            List of embeddings, in the same order as texts
+        """
+        async def embed_chunk(chunk: List[str]) -> List[List[float]]:
+            payload = {
+                "model": self.embedding_model,
+                "input": chunk
+            }
+
+            async with self._embed_semaphore:
+                response = await self._get_client().post(
+                    "/api/embed",
+                    json=payload,
+                    timeout=EMBED_TIMEOUT
+                )
+            if response.status_code != 200:
+                logger.error(f"Ollama embedding error: {response.status_code} - {response.text}")
+                raise Exception(f"Embedding request failed: {response.status_code}")
+
+            return response.json()["embeddings"]
+
+        try:
+            # Batches go out concurrently (bounded by the embed semaphore);
+            # gather preserves order, so results line up with texts
+            chunks = await asyncio.gather(*[
+                embed_chunk(texts[start:start + batch_size])
+                for start in range(0, len(texts), batch_size)
+            ])
+            return [embedding for chunk in chunks for embedding in chunk]
+
+        except Exception as e:
+            logger.error(f"Ollama batch embedding error: {e}", exc_info=True)
+            raise
+
     async def list_models(self) -> List[Dict]:
         """
         List available models in Ollama
@@ -153,16 +276,11 @@ class OllamaService:
             List of model info dicts
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/api/tags",
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status != 200:
-                        raise Exception(f"Failed to list models: {response.status}")
-
-                    result = await response.json()
-                    return result.get("models", [])
+            response = await self._get_client().get("/api/tags", timeout=METADATA_TIMEOUT)
+            if response.status_code != 200:
+                raise Exception(f"Failed to list models: {response.status_code}")
+
+            return response.json().get("models", [])
 
         except Exception as e:
             logger.error(f"Error listing models: {e}")
@@ -5,15 +5,16 @@ Combines vector search with LLM generation to provide accurate,
 grounded answers based on Hong Kong legal documents.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Optional, Any
+from typing import Callable, List, Dict, Optional, Any
 from qdrant_client import QdrantClient
 from qdrant_client.models import ScoredPoint
 
 from services.ollama_service import OllamaService
 from models.hk_legal_document import HKLegalDocument
 from models.hk_legal_section import HKLegalSection
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, undefer
 
 logger = logging.getLogger(__name__)
 
@@ -23,11 +24,13 @@ class RAGService:
 
     def __init__(
         self,
-        db_session: Session,
+        session_factory: Callable[[], Session],
         qdrant_client: QdrantClient,
         ollama_service: OllamaService
     ):
-        self.db = db_session
+        # A factory, not a Session: the service may outlive a request (agents keep
+        # theirs for the process) and each lookup runs in its own worker thread
+        self.session_factory = session_factory
         self.qdrant = qdrant_client
         self.ollama = ollama_service
 
@@ -38,7 +41,8 @@ class RAGService:
         search_type: str = "sections",  # "documents" or "sections"
         min_score: float = 0.5,
         include_metadata: bool = True,
-        max_context_length: int = 4000
+        max_context_length: int = 4000,
+        query_embedding: Optional[List[float]] = None
     ) -> Dict[str, Any]:
         """
         Perform RAG query: retrieve relevant context and generate answer
@@ -50,14 +54,16 @@ class RAGService:
             min_score: Minimum similarity score (0-1)
             include_metadata: Include source metadata in response
             max_context_length: Maximum characters for context
+            query_embedding: Precomputed question embedding (skips re-embedding)
 
         Returns:
             Dict with answer, sources, and metadata
         """
         try:
             # Step 1: Generate embedding for the question
-            logger.info(f"Generating embedding for question: {question[:100]}...")
-            query_embedding = await self.ollama.embed(question)
+            if query_embedding is None:
+                logger.info(f"Generating embedding for question: {question[:100]}...")
+                query_embedding = await self.ollama.embed(question)
 
             # Step 2: Search vector database
             logger.info(f"Searching {search_type} with top_k={top_k}")
@@ -136,7 +142,9 @@ class RAGService:
         # Use search method compatible with Qdrant 1.8.0
         from qdrant_client.models import SearchRequest
 
-        search_results = self.qdrant.search(
+        # The client is synchronous - keep the network round-trip off the event loop
+        search_results = await asyncio.to_thread(
+            self.qdrant.search,
             collection_name=collection_name,
             query_vector=query_embedding,
             limit=top_k
@@ -150,15 +158,39 @@ class RAGService:
         search_type: str
     ) -> List[Dict]:
         """Retrieve full content from database"""
-        context_items = []
+        # Blocking ORM queries run in a worker thread, on a session of their own
+        return await asyncio.to_thread(self._load_full_content, search_results, search_type)
 
-        for result in search_results:
-            db_id = result.payload.get("db_id")
+    def _load_full_content(
+        self,
+        search_results: List[ScoredPoint],
+        search_type: str
+    ) -> List[Dict]:
+        """Load the hits' sections or documents (synchronous, see _retrieve_full_content)"""
+        with self.session_factory() as db:
+            return self._build_context_items(db, search_results, search_type)
+
+    @staticmethod
+    def _build_context_items(
+        db: Session,
+        search_results: List[ScoredPoint],
+        search_type: str
+    ) -> List[Dict]:
+        """Query the hits' rows and turn them into context items"""
+        context_items = []
+        db_ids = [result.payload.get("db_id") for result in search_results]
+
+        if search_type == "sections":
+            # One query for all hits; parent documents via a single IN query (no join)
+            sections = {
+                section.id: section
+                for section in db.query(HKLegalSection)
+                .options(selectinload(HKLegalSection.document))
+                .filter(HKLegalSection.id.in_(db_ids))
+            }
 
-            if search_type == "sections":
-                section = self.db.query(HKLegalSection).filter(
-                    HKLegalSection.id == db_id
-                ).first()
+            for result, db_id in zip(search_results, db_ids):
+                section = sections.get(db_id)
 
                 if section:
                     # Get parent document info
@@ -175,10 +207,16 @@ class RAGService:
                         "doc_id": document.id,
                         "section_id": section.id
                     })
-            else:
-                document = self.db.query(HKLegalDocument).filter(
-                    HKLegalDocument.id == db_id
-                ).first()
+        else:
+            documents = {
+                document.id: document
+                for document in db.query(HKLegalDocument)
+                .options(undefer(HKLegalDocument.full_text_compressed))
+                .filter(HKLegalDocument.id.in_(db_ids))
+            }
+
+            for result, db_id in zip(search_results, db_ids):
+                document = documents.get(db_id)
 
                 if document:
                     context_items.append({
@@ -0,0 +1,274 @@
+"""
+Semantic Cache Service
+Caches LLM responses keyed on question embeddings
+
+A request whose embedding is within the similarity threshold of a previously
+answered request is served from the cache instead of re-running the LLM.
+
+Two tiers:
+- L1: small in-process ring buffer of normalized embeddings, probed with a
+  single matrix-vector product (no network round-trip)
+- L2: Qdrant collection shared across processes and restarts
+
+The Qdrant client is synchronous; its calls run in worker threads and LRU
+eviction runs as a background task, so neither blocks the event loop.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchValue,
+    PointIdsList,
+    PointStruct,
+    VectorParams
+)
+
+from services.ollama_service import OllamaService
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """Two-tier (in-process L1 + Qdrant L2) similarity-threshold response cache"""
+
+    COLLECTION_NAME = "rag_cache"
+    EVICTION_INTERVAL = 50  # Check capacity every N inserts
+
+    def __init__(
+        self,
+        qdrant_client: QdrantClient,
+        ollama_service: OllamaService,
+        collection_name: str = COLLECTION_NAME
+    ):
+        self.qdrant = qdrant_client
+        self.ollama = ollama_service
+        self.collection_name = collection_name
+        self.enabled = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+        self.threshold = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+        self.capacity = int(os.getenv("SEMANTIC_CACHE_CAPACITY", "1000"))
+        self._collection_ready = False
+        self._inserts_since_eviction = 0
+        self._eviction_task: Optional[asyncio.Task] = None
+
+        # L1 ring buffer - arrays are allocated on first insert once the dimension is known
+        self.l1_capacity = int(os.getenv("SEMANTIC_CACHE_L1_CAPACITY", "256"))
+        self._l1_keys: Optional[np.ndarray] = None  # (capacity, dim) float32, L2-normalized
+        self._l1_scopes = np.empty(self.l1_capacity, dtype=object)
+        self._l1_results: List[Optional[Dict[str, Any]]] = [None] * self.l1_capacity
+        self._l1_size = 0
+        self._l1_next = 0
+
+    def _ensure_collection(self, dimension: int):
+        """Create the cache collection on first use (dimension comes from the embedding model)"""
+        if self._collection_ready:
+            return
+
+        collections = self.qdrant.get_collections().collections
+        if self.collection_name not in [c.name for c in collections]:
+            self.qdrant.create_collection(
+                collection_name=self.collection_name,
+                vectors_config=VectorParams(size=dimension, distance=Distance.COSINE)
+            )
+            logger.info(f"Created Qdrant collection: {self.collection_name} (dim={dimension})")
+
+        self._collection_ready = True
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """Return the embedding as a unit-length float32 vector"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _l1_lookup(self, query: np.ndarray, scope: str) -> Optional[Dict[str, Any]]:
+        """Find the best L1 match above the threshold (cosine = dot product of unit vectors)"""
+        if self._l1_size == 0 or self._l1_keys.shape[1] != query.shape[0]:
+            return None
+
+        n = self._l1_size
+        scores = self._l1_keys[:n] @ query
+        scores[self._l1_scopes[:n] != scope] = -1.0
+
+        idx = int(np.argmax(scores))
+        if scores[idx] >= self.threshold:
+            logger.info(f"Semantic cache L1 hit (score={scores[idx]:.3f}, scope={scope})")
+            return self._l1_results[idx]
+
+        return None
+
+    def _l1_insert(self, query: np.ndarray, scope: str, result: Dict[str, Any]):
+        """Insert into the L1 ring buffer, overwriting the oldest entry when full"""
+        if self.l1_capacity <= 0:
+            return
+
+        if self._l1_keys is None or self._l1_keys.shape[1] != query.shape[0]:
+            # First insert, or the embedding model changed dimension
+            self._l1_keys = np.zeros((self.l1_capacity, query.shape[0]), dtype=np.float32)
+            self._l1_size = 0
+            self._l1_next = 0
+
+        idx = self._l1_next
+        self._l1_keys[idx] = query
+        self._l1_scopes[idx] = scope
+        self._l1_results[idx] = result
+
+        self._l1_next = (idx + 1) % self.l1_capacity
+        self._l1_size = min(self._l1_size + 1, self.l1_capacity)
+
+    async def lookup(self, text: str, scope: str) -> Tuple[Optional[List[float]], Optional[Dict[str, Any]]]:
+        """
+        Embed text and look for a semantically equivalent cached response
+
+        Args:
+            text: Text to embed (question or prompt)
+            scope: Cache partition key - only entries with the same scope can match
+
+        Returns:
+            Tuple of (embedding, cached result or None). The embedding is returned
+            so callers can reuse it on a cache miss; it is None if the cache is
+            disabled or embedding failed.
+        """
+        if not self.enabled:
+            return None, None
+
+        try:
+            embedding = await self.ollama.embed(text)
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return None, None
+
+        query = self._normalize(embedding)
+        cached = self._l1_lookup(query, scope)
+        if cached is not None:
+            return embedding, cached
+
+        try:
+            await asyncio.to_thread(self._ensure_collection, len(embedding))
+
+            hits = await asyncio.to_thread(
+                self.qdrant.search,
+                collection_name=self.collection_name,
+                query_vector=embedding,
+                query_filter=Filter(
+                    must=[FieldCondition(key="scope", match=MatchValue(value=scope))]
+                ),
+                limit=1
+            )
+
+            if hits and hits[0].score >= self.threshold:
+                hit = hits[0]
+                logger.info(f"Semantic cache L2 hit (score={hit.score:.3f}, scope={scope})")
+
+                # Refresh recency so LRU eviction keeps hot entries
+                await asyncio.to_thread(
+                    self.qdrant.set_payload,
+                    collection_name=self.collection_name,
+                    payload={"ts": time.time()},
+                    points=[hit.id]
+                )
+
+                # Promote to L1 so repeats skip the Qdrant round-trip
+                self._l1_insert(query, scope, hit.payload["result"])
+                return embedding, hit.payload["result"]
+
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+
+        return embedding, None
+
+    async def store(self, embedding: Optional[List[float]], text: str, scope: str, result: Dict[str, Any]):
+        """
+        Store a response in the cache
+
+        Args:
+            embedding: Embedding returned by lookup()
+            text: Original text (kept for debugging)
+            scope: Cache partition key
+            result: JSON-serializable response to cache
+        """
+        if not self.enabled or embedding is None:
+            return
+
+        self._l1_insert(self._normalize(embedding), scope, result)
+
+        try:
+            await asyncio.to_thread(self._ensure_collection, len(embedding))
+
+            await asyncio.to_thread(
+                self.qdrant.upsert,
+                collection_name=self.collection_name,
+                points=[
+                    PointStruct(
+                        id=str(uuid.uuid4()),
+                        vector=embedding,
+                        payload={
+                            "scope": scope,
+                            "question": text,
+                            "result": result,
+                            "ts": time.time()
+                        }
+                    )
+                ]
+            )
+
+            self._inserts_since_eviction += 1
+            if self._inserts_since_eviction >= self.EVICTION_INTERVAL:
+                self._inserts_since_eviction = 0
+                self._schedule_eviction()
+
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed: {e}")
+
+    def _schedule_eviction(self):
+        """Run _evict() in the background, at most one pass at a time"""
+        if self._eviction_task is not None and not self._eviction_task.done():
+            return
+
+        self._eviction_task = asyncio.create_task(self._evict_in_background())
+
+    async def _evict_in_background(self):
+        """Evict in a worker thread, logging failures (nobody awaits this task)"""
+        try:
+            await asyncio.to_thread(self._evict)
+        except Exception as e:
+            logger.warning(f"Semantic cache eviction failed: {e}")
+
+    def _evict(self):
+        """Delete least recently used entries when the cache exceeds capacity"""
+        count = self.qdrant.count(self.collection_name).count
+        if count <= self.capacity:
+            return
+
+        # Collect (ts, id) for all entries - the cache is small by design
+        entries = []
+        offset = None
+        while True:
+            points, offset = self.qdrant.scroll(
+                collection_name=self.collection_name,
+                limit=256,
+                offset=offset,
+                with_payload=["ts"],
+                with_vectors=False
+            )
+            entries.extend((p.payload.get("ts", 0), p.id) for p in points)
+            if offset is None:
+                break
+
+        entries.sort()
+        stale_ids = [point_id for _, point_id in entries[:count - self.capacity]]
+
+        self.qdrant.delete(
+            collection_name=self.collection_name,
+            points_selector=PointIdsList(points=stale_ids)
+        )
+        logger.info(f"Semantic cache evicted {len(stale_ids)} entries")
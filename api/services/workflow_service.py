@@ -4,8 +4,9 @@ Workflow Service Layer
 Handles persistence and conversion of custom workflows.
 """
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from models.custom_workflow import CustomWorkflow
 from workflows.workflow_engine import Workflow, WorkflowStep
 from datetime import datetime
@@ -213,6 +214,66 @@ class WorkflowService:
 
         return query.order_by(CustomWorkflow.created_at.desc()).all()
 
+    @staticmethod
+    def list_workflow_summaries(
+        db: Session,
+        category: Optional[str] = None,
+        is_active: Optional[bool] = True,
+        include_system: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        List workflow summaries without hydrating ORM objects
+
+        Selects only the summary columns (step_count is computed in the
+        database) and returns plain dicts in the to_workflow_summary() format.
+
+        Args:
+            db: Database session
+            category: Filter by category (optional)
+            is_active: Filter by active status (optional)
+            include_system: Include system workflows (default True)
+
+        Returns:
+            List of workflow summary dicts
+        """
+        query = select(
+            CustomWorkflow.workflow_id.label('id'),
+            CustomWorkflow.name,
+            CustomWorkflow.description,
+            CustomWorkflow.category,
+            CustomWorkflow.tags,
+            func.coalesce(func.jsonb_array_length(CustomWorkflow.steps), 0).label('step_count'),
+            CustomWorkflow.is_system,
+            CustomWorkflow.execution_count,
+            CustomWorkflow.last_executed
+        )
+
+        if category:
+            query = query.where(CustomWorkflow.category == category)
+
+        if is_active is not None:
+            query = query.where(CustomWorkflow.is_active == is_active)
+
+        if not include_system:
+            query = query.where(CustomWorkflow.is_system == False)
+
+        query = query.order_by(CustomWorkflow.created_at.desc())
+        return [dict(row) for row in db.execute(query).mappings()]
+
+    @staticmethod
+    def custom_workflows_fingerprint(db: Session) -> Tuple[int, Optional[datetime]]:
+        """
+        Cheap change marker for non-system workflows: (row count, newest updated_at)
+
+        Creating, updating (including deactivating) or deleting a workflow
+        changes it, so callers can skip reloading when it is unchanged.
+        """
+        count, last_updated = db.execute(
+            select(func.count(), func.max(CustomWorkflow.updated_at))
+            .where(CustomWorkflow.is_system == False)
+        ).one()
+        return count, last_updated
+
     @staticmethod
     def increment_execution_count(db: Session, workflow_id: str):
         """Increment execution count and update last_executed timestamp"""
@@ -258,6 +319,7 @@ class WorkflowService:
             "name": "legal_research",
             "agent_name": "legal_research",
             "description": "Research legal requirements",
+            "depends_on": ["previous_step"],  # optional; omitted = after all earlier steps
             "task_config": {
                 "input_mappings": {
                     "question": {"source": "input", "field": "compliance_question"},
@@ -311,5 +373,6 @@ class WorkflowService:
             name=step_def["name"],
             agent_name=step_def["agent_name"],
             task_builder=task_builder,
-            description=step_def.get("description", "")
+            description=step_def.get("description", ""),
+            depends_on=step_def.get("depends_on")
         )
@@ -4,6 +4,7 @@ Pre-built multi-agent workflows demonstrating platform capabilities
 Supports HR, Customer Service, and cross-domain use cases
 """
 
+from functools import lru_cache
 from typing import Dict, Any
 import logging
 
@@ -467,10 +468,13 @@ def register_reference_workflows(orchestrator):
     logger.info(f"  - {len(orchestrator.list_workflows())} workflows available")
 
 
+@lru_cache(maxsize=1)
 def get_workflow_examples() -> Dict[str, Any]:
     """
     Get example input data for each workflow
 
+    Built once and shared between callers - do not mutate the result.
+
     Returns:
         Dict mapping workflow names to example inputs
     """
@@ -504,10 +508,13 @@ def get_workflow_examples() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_workflow_descriptions() -> Dict[str, str]:
     """
     Get user-friendly descriptions for each workflow
 
+    Built once and shared between callers - do not mutate the result.
+
     Returns:
         Dict mapping workflow names to descriptions
     """
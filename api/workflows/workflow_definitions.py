@@ -248,8 +248,8 @@ def create_multi_agent_research_workflow() -> Workflow:
 
     Steps:
     1. Legal Research
-    2. HR Policy Research (parallel conceptually, sequential in execution)
-    3. CS Perspective (parallel conceptually, sequential in execution)
+    2. HR Policy Research (runs in parallel with 1 and 3)
+    3. CS Perspective (runs in parallel with 1 and 2)
     4. Analysis - Extract patterns
     5. Synthesis - Comprehensive report
     """
@@ -277,7 +277,8 @@ def create_multi_agent_research_workflow() -> Workflow:
             "context": inp.get("hr_context", ""),
             "task_type": "general"
         },
-        description="Research HR policy perspective"
+        description="Research HR policy perspective",
+        depends_on=[]
     ))
 
     # Step 3: Customer service perspective
@@ -288,7 +289,8 @@ def create_multi_agent_research_workflow() -> Workflow:
             "question": f"From a customer service perspective: {inp.get('research_topic', '')}",
             "context": inp.get("cs_context", "")
         },
-        description="Research customer service perspective"
+        description="Research customer service perspective",
+        depends_on=[]
     ))
 
     # Step 4: Analyze all perspectives
@@ -6,18 +6,30 @@ Handles multi-agent workflow execution with progress tracking and result aggrega
 
 import asyncio
 import time
-from typing import Dict, List, Any, Callable
+from typing import Dict, List, Any, Callable, Optional
 from datetime import datetime
 
+from agents.base_agent import run_agent
+
 
 class WorkflowStep:
     """Represents a single step in a workflow"""
 
-    def __init__(self, name: str, agent_name: str, task_builder: Callable, description: str = ""):
+    def __init__(
+        self,
+        name: str,
+        agent_name: str,
+        task_builder: Callable,
+        description: str = "",
+        depends_on: Optional[List[str]] = None
+    ):
         self.name = name
         self.agent_name = agent_name
         self.task_builder = task_builder  # Function that builds the task dict
         self.description = description
+        # Names of steps whose results this step needs. None = every earlier
+        # step (plain sequential execution); [] = can start immediately
+        self.depends_on = depends_on
         self.result = None
         self.error = None
         self.status = "pending"  # pending, running, completed, failed
@@ -85,36 +97,50 @@ class Workflow:
         }
 
         try:
-            for i, step in enumerate(self.steps):
-                step.status = "running"
-                step.start_time = time.time()
+            dependencies = self._dependencies()
+            pending = list(enumerate(self.steps))
+            completed = set()
+
+            while pending:
+                # Every step whose dependencies are done runs concurrently
+                ready = [(i, step) for i, step in pending if dependencies[step.name] <= completed]
+                pending = [(i, step) for i, step in pending if not dependencies[step.name] <= completed]
+
+                for _, step in ready:
+                    step.status = "running"
+                    step.start_time = time.time()
 
                 # Update progress
-                results["current_step"] = i + 1
+                results["current_step"] = ready[0][0] + 1
                 results["total_steps"] = len(self.steps)
                 results["steps"] = [s.to_dict() for s in self.steps]
 
-                # Get the agent
-                agent_info = agents_registry.get(step.agent_name)
-                if not agent_info or not agent_info.get("agent"):
-                    raise ValueError(f"Agent '{step.agent_name}' not found or not initialized")
+                outcomes = await asyncio.gather(
+                    *[self._run_step(step, agents_registry, initial_input) for _, step in ready],
+                    return_exceptions=True
+                )
 
-                agent = agent_info["agent"]
+                errors = []
+                for (i, step), outcome in zip(ready, outcomes):
+                    step.end_time = time.time()
 
-                # Build task using the task_builder function
-                task = step.task_builder(self.context, initial_input)
+                    if isinstance(outcome, BaseException):
+                        step.status = "failed"
+                        step.error = str(outcome)
+                        errors.append(outcome)
+                        continue
 
-                # Execute the agent
-                result = await agent.execute(task)
+                    # Store result
+                    step.result = outcome
+                    step.status = "completed"
+                    completed.add(step.name)
 
-                # Store result
-                step.result = result
-                step.status = "completed"
-                step.end_time = time.time()
+                    # Update context with this step's result
+                    self.context[f"step_{i + 1}_result"] = outcome
+                    self.context[step.name] = outcome
 
-                # Update context with this step's result
-                self.context[f"step_{i + 1}_result"] = result
-                self.context[step.name] = result
+                if errors:
+                    raise errors[0]
 
             # Workflow completed successfully
             self.status = "completed"
@@ -143,6 +169,36 @@ class Workflow:
 
         return results
 
+    def _dependencies(self) -> Dict[str, set]:
+        """Resolve each step's depends_on into a set of step names"""
+        names = [step.name for step in self.steps]
+        dependencies = {}
+
+        for i, step in enumerate(self.steps):
+            if step.depends_on is None:
+                dependencies[step.name] = set(names[:i])
+                continue
+
+            unknown = [name for name in step.depends_on if name not in names[:i]]
+            if unknown:
+                raise ValueError(f"Step '{step.name}' depends on unknown or later steps: {unknown}")
+            dependencies[step.name] = set(step.depends_on)
+
+        return dependencies
+
+    async def _run_step(self, step: WorkflowStep, agents_registry: Dict, initial_input: Dict) -> Dict:
+        """Build a step's task from the current context and run its agent"""
+        # Get the agent
+        agent_info = agents_registry.get(step.agent_name)
+        if not agent_info or not agent_info.get("agent"):
+            raise ValueError(f"Agent '{step.agent_name}' not found or not initialized")
+
+        # Build task using the task_builder function
+        task = step.task_builder(self.context, initial_input)
+
+        # Execute the agent
+        return await run_agent(agent_info["agent"], task)
+
     def to_dict(self):
         """Convert workflow to dictionary"""
         return {
@@ -165,24 +221,38 @@ class WorkflowRegistry:
 
     def __init__(self):
         self.workflows: Dict[str, Workflow] = {}
+        self._list_cache: Optional[List[Dict]] = None  # list_all() result, reset on change
 
     def register(self, workflow_id: str, workflow: Workflow):
         """Register a workflow"""
         self.workflows[workflow_id] = workflow
+        self._list_cache = None
+
+    def unregister(self, workflow_id: str):
+        """Remove a workflow if registered"""
+        if self.workflows.pop(workflow_id, None) is not None:
+            self._list_cache = None
 
     def get(self, workflow_id: str) -> Workflow:
         """Get a workflow by ID"""
         return self.workflows.get(workflow_id)
 
     def list_all(self) -> List[Dict]:
-        """List all available workflows"""
-        return [
-            {
-                "id": wf_id,
-                **workflow.to_dict()
-            }
-            for wf_id, workflow in self.workflows.items()
-        ]
+        """
+        List all available workflows
+
+        Registered workflows are never executed in place (see execute_workflow),
+        so their serialized form only changes through register/unregister.
+        """
+        if self._list_cache is None:
+            self._list_cache = [
+                {
+                    "id": wf_id,
+                    **workflow.to_dict()
+                }
+                for wf_id, workflow in self.workflows.items()
+            ]
+        return self._list_cache
 
     async def execute_workflow(self, workflow_id: str, agents_registry: Dict, user_input: Dict) -> Dict:
         """Execute a workflow by ID"""
@@ -195,7 +265,7 @@ class WorkflowRegistry:
         fresh_workflow = workflow_class.__new__(workflow_class)
         fresh_workflow.__dict__.update(workflow.__dict__.copy())
         fresh_workflow.steps = [
-            WorkflowStep(s.name, s.agent_name, s.task_builder, s.description)
+            WorkflowStep(s.name, s.agent_name, s.task_builder, s.description, s.depends_on)
             for s in workflow.steps
         ]
         fresh_workflow.status = "pending"